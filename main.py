@@ -11,12 +11,16 @@ Boot Profiler with live Settings panel (evdev-only toggle)
 - Settings 저장/불러오기/기본값 로드 지원 (settings_ui.json)
 """
 import argparse
+import bisect
+import functools
 import json
 import math
 import os
 import re
+import sys
 import time
 import threading
+import types
 import queue
 import random
 from collections import deque
@@ -35,6 +39,35 @@ except Exception:
     list_devices = None
     ecodes = None
 
+# inotify (event-driven log tail). optional dependency, linux only
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except Exception:
+    INotify = None
+    inotify_flags = None
+
+# Aho-Corasick (모든 패턴이 고정 문자열일 때 다중 매칭). optional dependency
+
+try:
+    import ahocorasick  # pip install pyahocorasick
+except Exception:
+    ahocorasick = None
+
+# Hyperscan (regex 패턴 집합을 하나의 DFA DB 로 매칭). optional dependency
+
+try:
+    import hyperscan
+except Exception:
+    hyperscan = None
+
+# orjson (settings_ui.json 직렬화/파싱). optional dependency
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # ------------------------------- Config Loader --------------------------------
 
 def parse_color(value):
@@ -59,6 +92,148 @@ def parse_color(value):
             return parse_color(parts)
     raise ValueError(f"Unsupported color format: {value}")
 
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+def build_classifier(entries):
+    """
+    entries: [(compiled_regex, info), ...] 우선순위(기존 검사 순서) 순.
+    모든 패턴을 하나의 alternation 으로 합쳐 라인당 regex 호출을 1회로 줄인다.
+    각 패턴은 lookahead 안의 named group 으로 감싸므로 match() 는 '라인 위치'가 아닌
+    '우선순위'상 첫 번째로 매칭되는 패턴을 돌려준다 (기존 first-match-wins 와 동일).
+    Returns (master_regex or None, {group_name: info}).
+    합칠 수 없는 패턴(역참조, 그룹 내부 inline flag 등)이 있으면 None -> 개별 검사 폴백.
+    """
+    if not entries:
+        return None, {}
+    # 합친 패턴도 개별 패턴과 같은 flag (re.ASCII 등)로 컴파일해야 의미가 같음
+    flags = entries[0][0].flags
+    if any(rx.flags != flags for rx, _ in entries):
+        return None, {}
+    parts = []
+    groups = {}
+    for i, (rx, info) in enumerate(entries):
+        if _BACKREF_RE.search(rx.pattern):
+            return None, {}
+        name = f"_c{i}"
+        parts.append(f"(?=.*?(?P<{name}>{rx.pattern}))")
+        groups[name] = info
+    try:
+        master = re.compile("|".join(parts), flags)
+    except re.error:
+        return None, {}
+    return master, groups
+
+def _literal_runs(rx):
+    """
+    패턴 최상위 시퀀스를 LITERAL 연속 구간들로 나눈다 -> (runs, all_literal).
+    파싱 불가/대소문자 무시 패턴이면 None.
+    """
+    if rx.flags & re.IGNORECASE:
+        return None
+    try:
+        try:
+            from re import _parser as sre_parse, _constants as sre_constants
+        except ImportError:  # Python < 3.11
+            import sre_parse, sre_constants  # type: ignore
+        data = list(sre_parse.parse(rx.pattern, rx.flags).data)
+    except Exception:
+        return None
+    runs, run = [], []
+    for op, av in data:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            runs.append("".join(run))
+        run = []
+    if run:
+        runs.append("".join(run))
+    all_literal = all(op is sre_constants.LITERAL for op, _ in data)
+    return runs, all_literal
+
+def required_literal(rx):
+    """
+    패턴이 매칭되려면 반드시 포함해야 하는 가장 긴 고정 문자열(최상위 LITERAL 연속 구간).
+    구할 수 없으면(대소문자 무시, 최상위 alternation 등) None.
+    """
+    res = _literal_runs(rx)
+    if res is None or not res[0]:
+        return None
+    return max(res[0], key=len)
+
+def pure_literal(rx):
+    """패턴 전체가 고정 문자열이면 그 문자열, 아니면 None."""
+    res = _literal_runs(rx)
+    if res is None or not res[1] or len(res[0]) != 1:
+        return None
+    return res[0][0]
+
+def build_literal_automaton(literals):
+    """
+    literals: 우선순위 순 고정 문자열 목록 (None -> 사용 불가).
+    값은 우선순위 index. 같은 문자열이 여러 번 나오면 가장 앞선 것만 등록.
+    """
+    if ahocorasick is None or not literals:
+        return None
+    A = ahocorasick.Automaton()
+    for i, lit in enumerate(literals):
+        if not A.exists(lit):
+            A.add_word(lit, i)
+    A.make_automaton()
+    return A
+
+# re 와 Hyperscan(PCRE 문법)이 다르게 해석하는 구문. 하나라도 있으면 DB 를 만들지 않는다.
+#   [:alpha:]  re: 문자 집합 / HS: POSIX class
+#   {,n}       re: {0,n} 반복 / HS: 리터럴 "{,n}"
+#   \N \v \Z   re: 이름 문자·VT 문자·절대 끝 / HS: 개행 제외·수직 공백 class·끝(개행 앞 허용)
+_HS_DIVERGENT_RE = re.compile(r"\[:|\{,|\\[NvZ]")
+
+def build_hyperscan_db(regexes):
+    """
+    우선순위 순 regex 들을 id=index 로 하나의 block-mode Hyperscan DB 로 컴파일.
+    미설치, 기본(UNICODE/ASCII) 외 flag 가 있는 패턴, 두 엔진이 다르게 읽는 구문이나
+    Hyperscan 이 지원하지 않는 문법이면 None (re 폴백).
+    DB 는 후보 id 만 고르는 prefilter 이고, 최종 판정은 classify_line 이 re 로 다시 확인한다.
+    """
+    if hyperscan is None:
+        return None
+    rxs = list(regexes)
+    if not rxs or any(rx.flags not in (re.UNICODE, re.ASCII) for rx in rxs):
+        return None
+    if any(_HS_DIVERGENT_RE.search(rx.pattern) for rx in rxs):
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        fl = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        if any(rx.flags == re.UNICODE for rx in rxs):
+            # \w, \d, \s 를 re 기본(Unicode)과 같게
+            fl |= hyperscan.HS_FLAG_UCP
+        db.compile(
+            expressions=[rx.pattern.encode("utf-8") for rx in rxs],
+            ids=list(range(len(rxs))),
+            elements=len(rxs),
+            flags=[fl] * len(rxs),
+        )
+    except Exception:
+        return None
+    return db
+
+def build_prefilter(regexes):
+    """All regexes' required literals, or None if any pattern lacks one (no prefilter)."""
+    lits = []
+    for rx in regexes:
+        lit = required_literal(rx)
+        if lit is None:
+            return None
+        lits.append(lit)
+    return tuple(dict.fromkeys(lits)) or None
+
+def load_yaml_text(text):
+    # libyaml 기반 CSafeLoader 가 있으면 사용 (순수 Python SafeLoader 보다 수 배 빠름)
+    import yaml  # type: ignore
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    return yaml.load(text, Loader=loader)
+
 def load_config(path):
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -67,13 +242,16 @@ def load_config(path):
         raise
 
     data = None
-    # Try JSON, fallback to YAML
-    try:
-        data = json.loads(text)
-    except Exception:
+    # .yaml/.yml 은 바로 YAML, 그 외는 JSON 먼저 시도 후 YAML 폴백
+    is_yaml = path.lower().endswith((".yaml", ".yml"))
+    if not is_yaml:
         try:
-            import yaml  # type: ignore
-            data = yaml.safe_load(text)
+            data = json.loads(text)
+        except Exception:
+            is_yaml = True
+    if is_yaml:
+        try:
+            data = load_yaml_text(text)
         except Exception as e:
             raise RuntimeError("Config is not valid JSON and PyYAML not available for YAML.") from e
 
@@ -85,10 +263,15 @@ def load_config(path):
     cfg["headroom_factor"] = float(data.get("headroom_factor", 1.05))
     cfg["scale_adjust_alpha"] = float(data.get("scale_adjust_alpha", 0.18))
 
+    # 부트 로그는 사실상 ASCII -> \w \d \s 를 ASCII 로 (SRE fast path).
+    # Unicode 문자 클래스가 필요한 로그는 "ascii_regex": false
+    cfg["ascii_regex"] = bool(data.get("ascii_regex", True))
+    re_flags = re.ASCII if cfg["ascii_regex"] else 0
+
     start_pat = data.get("start_pattern") or data.get("Start") or data.get("start")
     if not start_pat:
         raise ValueError("start_pattern is required in config")
-    cfg["start_pattern"] = re.compile(start_pat)
+    cfg["start_pattern"] = re.compile(start_pat, re_flags)
 
     # stages
     stages_raw = data.get("stages")
@@ -112,18 +295,22 @@ def load_config(path):
         if idx in seen_idxs:
             raise ValueError(f"duplicate stage index: {idx}")
         seen_idxs.add(idx)
-        name = item["name"]
+        # 스테이지 이름은 timeline/COLORS/displayed 등 여러 dict 의 key -> intern 해서
+        # marker target 과 같은 객체를 쓰게 함 (lookup 시 포인터 비교로 끝남)
+        name = sys.intern(str(item["name"]))
         pat = item.get("pattern")
         collected.append((idx, name, pat))
 
     collected.sort(key=lambda x: x[0])
     stages = [name for _, name, _ in collected]
+    stage_idx = {s: i for i, s in enumerate(stages)}
+    prev_stage = {s: (stages[i - 1] if i > 0 else None) for i, s in enumerate(stages)}
 
     # Optional per-stage patterns (fallback)
     stage_patterns = {}
     for _, name, pat in collected:
         if pat:
-            stage_patterns[name] = re.compile(pat)
+            stage_patterns[name] = re.compile(pat, re_flags)
 
     # colors
     colors_raw = data.get("colors", {})
@@ -153,10 +340,11 @@ def load_config(path):
             raise ValueError("marker 'when' must be 'start' or 'end'")
         if not pat or not target:
             raise ValueError("each marker must have 'pattern' and 'target'")
-        if target not in stages:
+        if target not in stage_idx:
             raise ValueError(f"marker target '{target}' not in stages")
+        target = sys.intern(target)
         markers.append({
-            "regex": re.compile(pat),
+            "regex": re.compile(pat, re_flags),
             "target": target,
             "when": when
         })
@@ -173,6 +361,19 @@ def load_config(path):
     # optional label animation duration
     cfg["label_anim_duration"] = float(data.get("label_anim_duration", 0.30))
 
+    # line classifier: start -> markers -> fallback patterns (기존 검사 순서 유지)
+    # info = (kind, target, when, prev): 전이표. prev 는 target 의 직전 스테이지(없으면 None)
+    entries = [(cfg["start_pattern"], ("start", None, None, None))]
+    entries += [(m["regex"], ("stage", m["target"], m["when"], prev_stage[m["target"]])) for m in markers]
+    entries += [(rx, ("stage", s, "start", prev_stage[s])) for s, rx in stage_patterns.items()]
+    master, groups = build_classifier(entries)
+    cfg["classify_entries"] = entries
+    cfg["classify_re"] = master
+    cfg["classify_groups"] = groups
+    cfg["prefilter_literals"] = build_prefilter(rx for rx, _ in entries)
+    literals = [pure_literal(rx) for rx, _ in entries]
+    cfg["classify_literals"] = literals if all(lit is not None for lit in literals) else None
+
     cfg["stages"] = stages
     cfg["patterns"] = stage_patterns
     cfg["colors"] = colors
@@ -193,11 +394,21 @@ except Exception as e:
 
 WINDOW_TITLE = CFG["window_title"]
 LOG_FILE = CFG["log_file"]
-START_RE = CFG["start_pattern"]          # compiled
 STAGES = CFG["stages"]                   # ordered by index
-PATTERNS = CFG["patterns"] or {}         # optional fallback compiled regex per stage
 COLORS = CFG["colors"]                   # name -> (r,g,b)
-MARKERS = CFG["markers"] or []           # [{regex, target, when}]
+CLASSIFY_ENTRIES = CFG["classify_entries"]  # [(regex, (kind, target, when, prev))] 우선순위 순
+CLASSIFY_RE = CFG["classify_re"]            # combined alternation (None -> 개별 검사)
+CLASSIFY_GROUPS = CFG["classify_groups"]    # group name -> (kind, target, when, prev)
+PREFILTER_LITERALS = CFG["prefilter_literals"]  # 필수 고정 문자열들 (None -> prefilter 없음)
+# 모든 패턴이 고정 문자열이고 pyahocorasick 이 있으면 regex 대신 한 번의 선형 스캔
+CLASSIFY_AUTOMATON = build_literal_automaton(CFG["classify_literals"])
+# pyahocorasick 이 없으면 고정 문자열은 regex 대신 `in` (C substring search) 으로 검사
+CLASSIFY_LITERAL_ENTRIES = (
+    [(lit, info) for lit, (_, info) in zip(CFG["classify_literals"], CLASSIFY_ENTRIES)]
+    if CFG["classify_literals"] else None
+)
+# 고정 문자열만으로 안 되는 (진짜 regex) 설정이면 Hyperscan DB 로 한 번에 스캔
+CLASSIFY_HS_DB = build_hyperscan_db(rx for rx, _ in CLASSIFY_ENTRIES) if not CFG["classify_literals"] else None
 
 ANIM_DURATION = CFG["anim_duration"]
 TICK_COUNT = CFG["tick_count"]
@@ -212,47 +423,157 @@ F8_ANIM_DURATION = CFG.get("f8_anim_duration", 0.5)
 # Label animation duration
 LABEL_ANIM_DURATION = CFG.get("label_anim_duration", 0.30)
 
+# 위 전역값들의 config 기준값 (Settings 창에서 바꾼 뒤 "Load defaults" 로 복원). 읽기 전용
+DEFAULT_GLOBALS = types.MappingProxyType({
+    "TICK_COUNT": int(TICK_COUNT),
+    "ANIM_DURATION": float(ANIM_DURATION),
+    "LABEL_ANIM_DURATION": float(LABEL_ANIM_DURATION),
+    "HEADROOM_FACTOR": float(HEADROOM_FACTOR),
+    "SCALE_ADJUST_ALPHA": float(SCALE_ADJUST_ALPHA),
+    "F8_VERTICAL_SECONDS": F8_VERTICAL_SECONDS if F8_VERTICAL_SECONDS is None else float(F8_VERTICAL_SECONDS),
+    "F8_HORIZONTAL_SECONDS": F8_HORIZONTAL_SECONDS if F8_HORIZONTAL_SECONDS is None else float(F8_HORIZONTAL_SECONDS),
+    "F8_ANIM_DURATION": float(F8_ANIM_DURATION),
+})
+
+# ------------------------------- GUI Wake -------------------------------------
+
+# GUI 가 idle 상태면 glfw.wait_events_timeout 으로 대기하므로, 다른 스레드에서
+# 새 데이터/핫키를 넣은 뒤에는 이 함수로 즉시 깨운다 (post_empty_event 는 thread-safe).
+GUI_IDLE_WAIT = 0.25
+# 입력/새 데이터/핫키가 있던 프레임 뒤로 idle 전에 더 그리는 프레임 수.
+# ImGui 는 창 auto-size, 접기 토글, hover 해제 등이 다음 프레임에 반영되므로
+GUI_SETTLE_FRAMES = 3
+
+def wake_gui():
+    try:
+        glfw.post_empty_event()
+    except Exception:
+        pass
+
 # ------------------------------- File Tail ------------------------------------
 
+def make_file_waiter(path):
+    """
+    Returns (wait, event_driven). wait(timeout_sec) 는 로그 파일 디렉터리에 변화
+    (쓰기/생성/삭제/이동)가 생기거나 timeout 이 지나면 반환한다.
+    inotify_simple 이 없거나 watch 등록에 실패하면 time.sleep 폴백 (기존 polling).
+    """
+    if INotify is None:
+        return time.sleep, False
+    try:
+        ino = INotify()
+        mask = (inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO
+                | inotify_flags.DELETE | inotify_flags.MOVED_FROM)
+        ino.add_watch(os.path.dirname(os.path.abspath(path)), mask)
+    except Exception:
+        return time.sleep, False
+
+    def wait(timeout):
+        try:
+            ino.read(timeout=int(timeout * 1000))
+        except Exception:
+            time.sleep(timeout)
+
+    return wait, True
+
+TAIL_READ_CHUNK = 65536
+TAIL_ROTATE_CHECK = 1.0   # 로그 파일 교체(삭제/rotate) 확인 주기 (초)
+TAIL_PARTIAL_FLUSH = 0.2  # '\n' 없는 마지막 줄을 내보내기 전, 파일이 안 커져야 하는 시간 (초)
+
+def _open_tail(path, from_start=False):
+    """Returns (fd, 읽기 시작 offset, inode)."""
+    fd = os.open(path, os.O_RDONLY)
+    st = os.fstat(fd)
+    pos = 0 if from_start else st.st_size
+    os.lseek(fd, pos, os.SEEK_SET)
+    return fd, pos, st.st_ino
+
+def _path_inode(path):
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return None
+
 def tail_file(path, callback):
+    """Follow path like `tail -f`; callback receives every batch of newly read lines (list)."""
+    wait, event_driven = make_file_waiter(path)
+    # inotify 가 깨워주면 timeout 은 안전망일 뿐이므로 길게 잡는다
+    idle_wait = 1.0 if event_driven else 0.01
     while not os.path.exists(path):
-        time.sleep(0.5)
-    f = open(path, "r", encoding="utf-8", errors="ignore")
+        wait(0.5)
+    # TextIOWrapper 대신 fd 에서 큰 덩어리로 읽고, 완성된 줄만 한 번에 decode
+    fd, last_size, ino = _open_tail(path)
+    next_check = time.monotonic() + TAIL_ROTATE_CHECK
+    buf = bytearray()   # 아직 '\n' 이 안 온 마지막 줄
+    last_growth = time.monotonic()  # 파일이 마지막으로 커진 시각
     try:
-        f.seek(0, 2)
         while True:
-            line = f.readline()
-            if not line:
-                time.sleep(0.01)
-                if not os.path.exists(path):
-                    f.close()
-                    while not os.path.exists(path):
-                        time.sleep(0.5)
-                    f = open(path, "r", encoding="utf-8", errors="ignore")
-                    f.seek(0, 2)
+            size = os.fstat(fd).st_size
+            if size == last_size:
+                timeout = idle_wait
+                if buf:
+                    # 미완성 줄(login 프롬프트 등)은 TAIL_PARTIAL_FLUSH 동안 더 안 쓰이면 그대로 내보냄.
+                    # 그 전에는 대기 -> 두 번에 나눠 쓰인 줄(serial capture, 버퍼링 writer)도 한 줄로 분류
+                    quiet = time.monotonic() - last_growth
+                    if quiet >= TAIL_PARTIAL_FLUSH:
+                        callback([buf.decode("utf-8", "ignore")])
+                        buf.clear()
+                    else:
+                        timeout = min(timeout, TAIL_PARTIAL_FLUSH - quiet)
+                wait(timeout)
+                # 교체 확인은 매 대기마다가 아니라 주기적으로 stat 1회 (inode 비교)
+                now_m = time.monotonic()
+                if now_m >= next_check:
+                    next_check = now_m + TAIL_ROTATE_CHECK
+                    if _path_inode(path) != ino:
+                        os.close(fd)
+                        while not os.path.exists(path):
+                            wait(0.5)
+                        # 새 파일은 전부 새 내용 -> 처음부터 읽음
+                        fd, last_size, ino = _open_tail(path, from_start=True)
                 continue
-            callback(line)
+            if size < last_size:
+                # truncate 된 로그 -> 처음부터 다시 읽음
+                os.lseek(fd, 0, os.SEEK_SET)
+                buf.clear()
+            last_size = size
+            last_growth = time.monotonic()
+            while True:
+                chunk = os.read(fd, TAIL_READ_CHUNK)
+                if not chunk:
+                    break
+                buf += chunk
+                if len(chunk) < TAIL_READ_CHUNK:
+                    break
+            cut = buf.rfind(b"\n") + 1
+            if cut:
+                lines = buf[:cut].decode("utf-8", "ignore").splitlines()
+                del buf[:cut]
+                if lines:
+                    callback(lines)
     finally:
         try:
-            f.close()
+            os.close(fd)
         except Exception:
             pass
 
 # ------------------------------- Math / Labels --------------------------------
 
+# 자릿수(mag) 안에서 고를 수 있는 "보기 좋은" 배수 (오름차순, 마지막 10 은 다음 자릿수)
+NICE_STEPS = (1, 1.1, 1.2, 1.25, 1.5, 2, 2.5, 5, 10)
+
 def closer_nice_max(value):
     if value <= 0:
         return 1.0
     target = value * HEADROOM_FACTOR
     exp = math.floor(math.log10(max(target, 1e-12)))
     mag = 10 ** exp
-    candidates = [1, 1.1, 1.2, 1.25, 1.5, 2, 2.5, 5]
-    for c in candidates:
-        cand = c * mag
-        if cand >= target - 1e-12:
-            return float(cand)
-    return float(10 * mag)
+    i = bisect.bisect_left(NICE_STEPS, (target - 1e-12) / mag)
+    return float(NICE_STEPS[min(i, len(NICE_STEPS) - 1)] * mag)
 
+# 축 라벨/막대 라벨은 스케일·duration 이 멈춰 있는 동안(부팅 완료 후 대부분) 매 프레임
+# 같은 값으로 호출됨 -> 값 그대로를 key 로 memoize (표시 정밀도는 그대로)
+@functools.lru_cache(maxsize=256)
 def format_label(val: float) -> str:
     decimals = 1 if val >= 10 else 2 if val >= 1 else 3
     s = f"{val:.{decimals}f}"
@@ -269,89 +590,236 @@ def format_label(val: float) -> str:
         s = f"{sign}{s}.0"
     return s + "s"
 
+@functools.lru_cache(maxsize=64)
+def tick_labels(max_scale: float, tick_count: int):
+    """눈금 i=0..tick_count 의 (비율, 라벨). 스케일이 바뀔 때만 새로 계산."""
+    return tuple(
+        (i / float(tick_count), format_label(max_scale * (i / float(tick_count))))
+        for i in range(tick_count + 1)
+    )
+
+@functools.lru_cache(maxsize=64)
+def format_stage_duration(stage: str, dur: float) -> str:
+    return f"{stage}: {dur:.3f}s"
+
+@functools.lru_cache(maxsize=256)
 def fmt_hms_hundredths(ts):
+    # Summary 테이블이 매 프레임 같은 start/end 값으로 호출 -> 타임스탬프별 memoize
     if not ts:
         return "-"
     dt = datetime.fromtimestamp(ts)
     return f"{dt.strftime('%H:%M:%S')}.{dt.microsecond // 10000:02d}"
 
+def _q05(x: float) -> float:
+    """0.5 단위 양자화 (round: x*2 가 정확히 .5 면 짝수 쪽). F8 스케일 값은 모두 이 함수로."""
+    return round(x * 2.0) / 2.0
+
+# F8 프리셋 스케일 허용 범위 (좌: vertical, 우: horizontal)
+F8_LEFT_MIN, F8_LEFT_MAX = 1.0, 60.0
+F8_RIGHT_MIN, F8_RIGHT_MAX = 1.0, 40.0
+
+def _q05_in_range(x, lo, hi):
+    """x 를 _q05 로 0.5 단위 양자화하고 [lo, hi] 로 clamp. x 가 None/변환 불가면 None."""
+    if x is None:
+        return None
+    try:
+        v = _q05(float(x))
+    except Exception:
+        return None
+    return min(max(v, lo), hi)
+
+SMOOTH_SNAP_EPS = 1e-4
+
+def smooth_toward(cur: float, target: float, alpha: float) -> float:
+    """지수 평활 한 스텝. 충분히 가까우면 target 으로 붙여서 수렴 후엔 값이 더 안 바뀜."""
+    diff = target - cur
+    if -SMOOTH_SNAP_EPS < diff < SMOOTH_SNAP_EPS:
+        return target
+    return cur + diff * alpha
+
 def ease_out_cubic(x: float) -> float:
     x = max(0.0, min(1.0, x))
     return 1 - (1 - x) ** 3
 
 # ------------------------------- Timeline / Parser ----------------------------
 
-def compute_durations(timeline):
-    durations = {}
-    now = time.time()
+def publish_timeline(timeline, snapshot):
+    """
+    timeline 을 수정한 writer 가 lock 을 잡은 채로 호출.
+    GUI 용 불변 스냅샷 {stage: (start, end)} 을 새로 만들어 snapshot[0] 에 한 번에 대입한다.
+    리스트 슬롯 대입은 CPython 에서 atomic 이므로 GUI 는 lock 없이 snapshot[0] 을 읽는다.
+    """
+    snapshot[0] = {s: (timeline[s]["start"], timeline[s]["end"]) for s in STAGES}
+
+def summarize_durations(timeline):
+    """
+    timeline: publish_timeline() 스냅샷 {stage: (start, end)}
+    Returns (종료된 스테이지 duration 합, 진행 중 스테이지 start 목록).
+    스냅샷은 바뀔 때만 새 객체로 교체되므로 GUI 는 스냅샷당 한 번만 호출하고,
+    매 프레임 total = closed_total + sum(now - start for start in live_starts).
+    """
+    closed_total = 0.0
+    live_starts = []
     for stage in STAGES:
-        start = timeline[stage].get("start")
-        end = timeline[stage].get("end")
-        try:
-            if start and end:
-                durations[stage] = max(0.0, end - start)
-            elif start and not end:
-                durations[stage] = max(0.0, now - start)
-            else:
-                durations[stage] = 0.0
-        except Exception:
-            durations[stage] = 0.0
-    return durations
+        start, end = timeline[stage]
+        if start and end:
+            closed_total += max(0.0, end - start)
+        elif start:
+            live_starts.append(start)
+    return closed_total, tuple(live_starts)
+
+def summary_span(timeline):
+    """스냅샷에서 (가장 이른 start, 가장 늦은 end). Summary 의 TOTAL 행용, 없으면 None."""
+    starts = [timeline[s][0] for s in STAGES if timeline[s][0]]
+    ends = [timeline[s][1] for s in STAGES if timeline[s][1]]
+    return (min(starts) if starts else None), (max(ends) if ends else None)
+
+def _hs_on_match(idx, frm, to, flags, hits):
+    # hits: 매칭된 후보 id 목록 (SINGLEMATCH 라 id 당 한 번). re 확인 전이라 스캔은 끝까지
+    hits.append(idx)
+
+def classify_line(line: str):
+    """Return (kind, target, when, prev) of the first matching start/marker/pattern, or None."""
+    if CLASSIFY_AUTOMATON is not None:
+        # 라인 안의 모든 hit 중 우선순위(index)가 가장 앞선 것
+        best = None
+        for _, i in CLASSIFY_AUTOMATON.iter(line):
+            if best is None or i < best:
+                best = i
+                if i == 0:
+                    break
+        return CLASSIFY_ENTRIES[best][1] if best is not None else None
+    if CLASSIFY_LITERAL_ENTRIES is not None:
+        for lit, info in CLASSIFY_LITERAL_ENTRIES:
+            if lit in line:
+                return info
+        return None
+    # 대부분의 라인은 어떤 패턴의 필수 문자열도 포함하지 않음 -> regex 없이 바로 탈락
+    if PREFILTER_LITERALS is not None and not any(lit in line for lit in PREFILTER_LITERALS):
+        return None
+    if CLASSIFY_HS_DB is not None:
+        hits = []
+        CLASSIFY_HS_DB.scan(line.encode("utf-8"), match_event_handler=_hs_on_match, context=hits)
+        # 후보를 우선순위 순으로 re 로 확인 (엔진 간 의미 차이로 인한 오분류 방지)
+        for i in sorted(hits):
+            rx, info = CLASSIFY_ENTRIES[i]
+            if rx.search(line):
+                return info
+        return None
+    if CLASSIFY_RE is not None:
+        mo = CLASSIFY_RE.match(line)
+        return CLASSIFY_GROUPS[mo.lastgroup] if mo else None
+    for rx, info in CLASSIFY_ENTRIES:
+        if rx.search(line):
+            return info
+    return None
+
+def advance_stage(timeline, target, prev, when, now):
+    """
+    Stage 전이 1건 적용 (lock 을 잡은 상태에서 호출).
+    start: target 시작(최초 1회) + 진행 중이던 직전 스테이지 종료 / end: target 종료.
+    """
+    if when == "start":
+        cur = timeline[target]
+        if cur["start"] is None:
+            cur["start"] = now
+        if prev is not None:
+            p = timeline[prev]
+            if p["start"] and p["end"] is None:
+                p["end"] = now
+    elif when == "end":
+        timeline[target]["end"] = now
+
+def reset_timeline(timeline, first_start=None):
+    """
+    모든 스테이지 초기화 (lock 을 잡은 상태에서 호출).
+    first_start 가 있으면 첫 스테이지를 그 시각에 시작 (start-pattern 감지 시).
+    """
+    for stage in STAGES:
+        timeline[stage]["start"] = None
+        timeline[stage]["end"] = None
+    if first_start is not None and STAGES:
+        timeline[STAGES[0]]["start"] = first_start
 
-def log_thread(log_lines, timeline, lock, control_q):
-    def process_line(raw_line: str):
-        line = raw_line.replace("\t", " ").strip()
-        if not line:
-            return
+def format_log_entry(entry):
+    """log_lines 항목 (ts, line) -> Log 패널 표시 문자열"""
+    return f"{entry[0]} - {entry[1]}"
+
+def log_thread(log_lines, timeline, timeline_snapshot, lock, control_q, dirty, log_mark):
+    """
+    log_mark: [마지막 start-pattern 라인의 log_lines 항목]. GUI 의 AUTO_RESET 이 그 앞까지만
+    지우는 데 쓰고 비운다. 그 항목이 maxlen 으로 밀려나면 None (남은 건 모두 이후 라인).
+    mark 가 있는 동안의 append 와 GUI 쪽 정리는 lock 으로 직렬화.
+    """
+    # 같은 초 안에 들어온 라인은 strftime 결과를 재사용: [epoch second, "%H:%M:%S"]
+    ts_cache = [-1, ""]
+    # 중복 라인 판정용으로 마지막에 append 한 항목 (GUI 가 reset 중 비우는 deque 를 읽지 않음)
+    last_entry = [None]
+    maxlen = log_lines.maxlen
 
+    def process_lines(raw_lines):
         now = time.time()
-        ts = time.strftime('%H:%M:%S', time.localtime(now))
-        new_line = f"{ts} - {line}"
+        sec = int(now)
+        if sec != ts_cache[0]:
+            ts_cache[0] = sec
+            ts_cache[1] = time.strftime('%H:%M:%S', time.localtime(now))
+        ts = ts_cache[1]
+
+        # 분류(regex)와 로그 추가는 lock 밖에서 배치 단위로.
+        # log_lines 에 append 하는 건 이 스레드뿐이고 deque.append 는 원자적이라 lock 불필요
+        hits = []
+        added = False
+        for raw_line in raw_lines:
+            line = raw_line.replace("\t", " ").strip()
+            if not line:
+                continue
+            # (공유되는 ts 문자열, 라인) 만 저장; 표시 문자열은 Log 패널이 clipping 으로 고른
+            # 보이는 줄에 대해서만 렌더 시 생성 (format_log_entry)
+            entry = (ts, line)
+            if entry != last_entry[0]:
+                if log_mark[0] is None:
+                    log_lines.append(entry)
+                else:
+                    # GUI 의 AUTO_RESET 로그 정리가 아직이면 그 정리/F10 clear 와 같은 lock 아래서
+                    # append (start 라인이 maxlen 으로 밀려나는지 판정과 GUI 의 popleft 가 엇갈리지 않게)
+                    with lock:
+                        mark = log_mark[0]
+                        if mark is not None and len(log_lines) == maxlen and log_lines[0] is mark:
+                            log_mark[0] = None
+                        log_lines.append(entry)
+                last_entry[0] = entry
+                added = True
+            hit = classify_line(line)
+            if hit is not None:
+                if hit[0] == "start":
+                    log_mark[0] = last_entry[0]
+                hits.append(hit)
+        if not hits and not added:
+            return
 
-        with lock:
-            if not log_lines or log_lines[-1] != new_line:
-                log_lines.append(new_line)
+        # 타임라인 갱신만 lock 안에서, 배치당 1회 (라인 순서 유지)
+        if hits:
+            with lock:
+                for kind, target, when, prev in hits:
+                    if kind == "start":
+                        # start-pattern: 타임라인 초기화 + 첫 스테이지 시작을 라인 순서대로 여기서 적용
+                        # (같은 배치의 뒤 라인 전이가 리셋에 지워지지 않게).
+                        # GUI 에는 표시 상태(애니메이션/스케일/로그) 초기화만 요청
+                        reset_timeline(timeline, now)
+                        try:
+                            control_q.put("AUTO_RESET")
+                        except Exception:
+                            pass
+                        continue
 
-        # start - 이제 AUTO_RESET 신호를 GUI로 보냄
-        if START_RE.search(line):
-            # send control message to GUI to reset+start (GUI will set first stage start)
-            try:
-                control_q.put("AUTO_RESET")
-            except Exception:
-                pass
-            return
+                    # markers / fallback patterns
+                    advance_stage(timeline, target, prev, when, now)
+                publish_timeline(timeline, timeline_snapshot)
 
-        # markers
-        for m in MARKERS:
-            if m["regex"].search(line):
-                target = m["target"]; when = m["when"]
-                with lock:
-                    if when == "start":
-                        if timeline[target].get("start") is None:
-                            timeline[target]["start"] = now
-                        idx = STAGES.index(target)
-                        if idx - 1 >= 0:
-                            prev = STAGES[idx - 1]
-                            if timeline[prev].get("start") and timeline[prev].get("end") is None:
-                                timeline[prev]["end"] = now
-                    elif when == "end":
-                        timeline[target]["end"] = now
-                return
-
-        # fallback
-        for s, rx in PATTERNS.items():
-            if rx.search(line):
-                with lock:
-                    if timeline[s].get("start") is None:
-                        timeline[s]["start"] = now
-                    idx = STAGES.index(s)
-                    if idx - 1 >= 0:
-                        prev = STAGES[idx - 1]
-                        if timeline[prev].get("start") and timeline[prev].get("end") is None:
-                            timeline[prev]["end"] = now
-                return
+        dirty.set()
+        wake_gui()
 
-    tail_file(LOG_FILE, process_line)
+    tail_file(LOG_FILE, process_lines)
 
 # ------------------------------- Test Sequence Writer -------------------------
 
@@ -411,12 +879,18 @@ if ecodes is not None:
     }
 
 def _device_worker(dev: "InputDevice", q: "queue.Queue[str]"):
+    # 키 반복 입력 중에도 이벤트마다 전역/속성 조회를 하지 않도록 로컬 바인딩
+    EV_KEY = ecodes.EV_KEY
+    get_action = HOTKEY_MAP.get
+    put = q.put
     try:
         for e in dev.read_loop():
-            if e.type == ecodes.EV_KEY and e.value == 1:
-                act = HOTKEY_MAP.get(e.code)
-                if act:
-                    q.put(act)
+            if e.type != EV_KEY or e.value != 1:
+                continue
+            act = get_action(e.code)
+            if act:
+                put(act)
+                wake_gui()
     except Exception:
         pass
     finally:
@@ -479,13 +953,16 @@ def attach_window_hotkeys(window, q: "queue.Queue[str]"):
         glfw.KEY_F8:     "SET_F8_SCALES",
     }
 
+    PRESS = glfw.PRESS
+    get_action = GLWF_KEY_MAP.get
+
     # define our callback which will call the previous callback if present
     def _key_cb(window_handle, key, scancode, action, mods):
         try:
             # debug line (remove or guard behind a verbose flag in production)
             # print(f"[kb] key={key} action={action} mods={mods}")
-            if action == glfw.PRESS:
-                act = GLWF_KEY_MAP.get(key)
+            if action == PRESS:
+                act = get_action(key)
                 if act:
                     try:
                         q.put(act)
@@ -525,28 +1002,101 @@ def attach_window_hotkeys(window, q: "queue.Queue[str]"):
 
 # ------------------------------- ImGui Helpers --------------------------------
 
+# packed u32 색상 캐시. get_color_u32_rgba 는 imgui context 가 있어야 하므로
+# 첫 프레임에서 lazy 하게 채운다. (alpha 가 매 프레임 바뀌는 색상에는 쓰지 말 것)
+_COLOR_U32 = {}
+_STAGE_COLORS_U32 = {}
+
+def color_u32(r, g, b, a=1.0):
+    key = (r, g, b, a)
+    c = _COLOR_U32.get(key)
+    if c is None:
+        c = _COLOR_U32[key] = imgui.get_color_u32_rgba(r, g, b, a)
+    return c
+
+def faded_color_u32(r, g, b, a, alpha):
+    # 페이드인이 끝난(alpha=1) 정상 상태는 캐시, 페이드 중에만 매번 pack
+    if alpha >= 1.0:
+        return color_u32(r, g, b, a)
+    return imgui.get_color_u32_rgba(r, g, b, a * alpha)
+
+def stage_colors_u32():
+    """stage -> packed u32 color (불투명)."""
+    if not _STAGE_COLORS_U32:
+        for s in STAGES:
+            _STAGE_COLORS_U32[s] = imgui.get_color_u32_rgba(*COLORS[s], 1)
+    return _STAGE_COLORS_U32
+
+def _avail_from_vec2():
+    avail = imgui.get_content_region_avail()
+    return (float(avail.x), float(avail.y))
+
+def _avail_from_tuple():
+    avail = imgui.get_content_region_avail()
+    return (float(avail[0]), float(avail[1]))
+
+def _avail_from_window():
+    wp = imgui.get_window_position()
+    ws = imgui.get_window_size()
+    cp = imgui.get_cursor_screen_pos()
+    avail_w = ws[0] - (cp[0] - wp[0])
+    avail_h = ws[1] - (cp[1] - wp[1])
+    return (max(float(avail_w), 1.0), max(float(avail_h), 1.0))
+
+# 바인딩 버전별로 동작하는 반환 형태(Vec2/tuple)를 첫 성공 시 고정 (매번 두 형태를 시도하지 않음).
+# 창 geometry 폴백은 고정하지 않는다 (그 호출에서만 실패했을 수 있으므로)
+_avail_impl = None
+
 def get_content_region_avail_safe():
+    global _avail_impl
+    if _avail_impl is not None:
+        try:
+            return _avail_impl()
+        except Exception:
+            pass
+    else:
+        for impl in (_avail_from_vec2, _avail_from_tuple):
+            try:
+                res = impl()
+            except Exception:
+                continue
+            _avail_impl = impl
+            return res
+    # 캐시된 구현이 실패했거나 두 형태 모두 안 되면 창 geometry 로 계산
     try:
-        avail = imgui.get_content_region_avail()
-        if hasattr(avail, "x") and hasattr(avail, "y"):
-            return (float(avail.x), float(avail.y))
-        return (float(avail[0]), float(avail[1]))
+        return _avail_from_window()
     except Exception:
+        return (400.0, 300.0)
+
+# ---- (버전 호환) Settings 섹션 시작/종료 래퍼 ----
+TREE_NODE_DEFAULT_OPEN = getattr(imgui, "TREE_NODE_DEFAULT_OPEN", 1 << 5)
+
+def begin_section(label: str, default_open: bool = True):
+    fl = TREE_NODE_DEFAULT_OPEN if default_open else 0
+    if hasattr(imgui, "tree_node_ex"):
+        # 신버전: bool 하나 반환
+        opened = bool(imgui.tree_node_ex(label, fl))
+        return opened, True   # True => 나중에 tree_pop 필요
+    else:
+        # 구버전: collapsing_header 가 (expanded, visible) 튜플을 반환할 수 있음
         try:
-            wp = imgui.get_window_position()
-            ws = imgui.get_window_size()
-            cp = imgui.get_cursor_screen_pos()
-            avail_w = ws[0] - (cp[0] - wp[0])
-            avail_h = ws[1] - (cp[1] - wp[1])
-            return (max(float(avail_w), 1.0), max(float(avail_h), 1.0))
-        except Exception:
-            return (400.0, 300.0)
+            res = imgui.collapsing_header(label, flags=fl)
+        except TypeError:
+            res = imgui.collapsing_header(label)
+        opened = res[0] if isinstance(res, tuple) else bool(res)
+        return opened, False  # False => tree_pop 불필요
+
+def end_section(need_pop: bool):
+    if need_pop and hasattr(imgui, "tree_pop"):
+        imgui.tree_pop()
 
 def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
                         *, legend_side="left", legend_align="center",
-                        legend_reverse=True):
+                        legend_reverse=True, text_cache=None):
     """
     Draw stacked vertical bar with legend and per-segment percent.
+    text_cache: 호출 측이 프레임 간 유지하는 dict. calc_text_size 결과를 재사용
+                (("legend", stage) -> (w, h), ("pct", stage) -> (text, w, h))
     Returns geometry dict: {"bar_top","bar_bottom","bar_x","bar_w","last_tip_x","last_tip_y"}
     """
     x, y = pos
@@ -568,15 +1118,34 @@ def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
     LEGEND_TEXT_RATIO = float(settings.get("legend_text_ratio", 0.08))  # 화면 폭 비율
     # -------------------
 
-    axis_color   = imgui.get_color_u32_rgba(1, 1, 1, 1)
-    grid_color   = imgui.get_color_u32_rgba(0.6, 0.6, 0.6, 1)
-    shadow_color = imgui.get_color_u32_rgba(0, 0, 0, 0.8)
+    axis_color   = color_u32(1, 1, 1, 1)
+    grid_color   = color_u32(0.6, 0.6, 0.6, 1)
+    shadow_color = color_u32(0, 0, 0, 0.8)
+    stage_colors = stage_colors_u32()
+
+    # draw_list 메서드는 루프에서 반복 호출되므로 로컬에 바인딩
+    add_rect = draw_list.add_rect
+    add_rect_filled = draw_list.add_rect_filled
+    add_line = draw_list.add_line
+    add_text = draw_list.add_text
+
+    if text_cache is None:
+        text_cache = {}
+
+    def legend_text_size(stage):
+        # 스테이지 이름은 고정 -> 처음 한 번만 측정
+        key = ("legend", stage)
+        ts = text_cache.get(key)
+        if ts is None:
+            tsize = imgui.calc_text_size(stage)
+            ts = text_cache[key] = (float(tsize.x), float(tsize.y))
+        return ts
 
     # 레전드 폭 상한/하한
     MAX_LEGEND_TEXT_PX = min(160.0, max(40.0, w * LEGEND_TEXT_RATIO))
 
     try:
-        text_widths = [imgui.calc_text_size(s).x for s in STAGES]
+        text_widths = [legend_text_size(s)[0] for s in STAGES]
         max_text_w = max(text_widths) if text_widths else 60.0
     except Exception:
         max_text_w = 60.0
@@ -608,7 +1177,7 @@ def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
     bar_top = bar_bottom - max_bar_h
 
     # 외곽선
-    draw_list.add_rect(bar_x, bar_top, bar_x + bar_w, bar_bottom, axis_color)
+    add_rect(bar_x, bar_top, bar_x + bar_w, bar_bottom, axis_color)
 
     # 합(퍼센트용)
     total_for_ratio = max(sum(displayed.values()), 1e-9)
@@ -622,27 +1191,33 @@ def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
         dur = displayed.get(stage, 0.0)
         ratio = (dur / max_scale) if max_scale > 0 else 0.0
         height = max_bar_h * min(max(ratio, 0.0), 1.0)
-        color = imgui.get_color_u32_rgba(*COLORS[stage], 1)
+        color = stage_colors[stage]
 
         seg_top = current_y - height
         seg_bottom = current_y
         seg_cy = (seg_top + seg_bottom) * 0.5
 
-        draw_list.add_rect_filled(bar_x, seg_top, bar_x + bar_w, seg_bottom, color)
+        if height > 0.0:  # 아직 시작 안 한 스테이지는 빈 rect 를 submit 하지 않음
+            add_rect_filled(bar_x, seg_top, bar_x + bar_w, seg_bottom, color)
 
         # 퍼센트 라벨(바 바로 옆)
         if SHOW_PCT and dur > 0.0 and total_for_ratio > 0.0:
             pct = (dur / total_for_ratio) * 100.0
             pct_text = f"{pct:.{PCT_DIGITS}f}%"
-            try:
-                tsize = imgui.calc_text_size(pct_text)
-                tw, th = float(tsize.x), float(tsize.y)
-            except Exception:
-                tw, th = 36.0, 14.0
+            cached = text_cache.get(("pct", stage))
+            if cached is not None and cached[0] == pct_text:
+                tw, th = cached[1], cached[2]
+            else:
+                try:
+                    tsize = imgui.calc_text_size(pct_text)
+                    tw, th = float(tsize.x), float(tsize.y)
+                    text_cache[("pct", stage)] = (pct_text, tw, th)
+                except Exception:
+                    tw, th = 36.0, 14.0
             tx = min(bar_x + bar_w + PCT_GAP, panel_right - tw)
             ty = seg_cy - th * 0.5 + PCT_TOP_OFFSET
-            draw_list.add_text(tx + 1, ty + 1, shadow_color, pct_text)
-            draw_list.add_text(tx, ty, axis_color, pct_text)
+            add_text(tx + 1, ty + 1, shadow_color, pct_text)
+            add_text(tx, ty, axis_color, pct_text)
 
         if idx == len(STAGES) - 1:
             last_seg_top = seg_top
@@ -651,12 +1226,10 @@ def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
 
     # 눈금/라벨
     label_x = max(bar_x - TICK_LABEL_LEFT, label_x_min)
-    for i in range(0, TICK_COUNT + 1):
-        r = i / float(TICK_COUNT)
+    for r, label in tick_labels(max_scale, TICK_COUNT):
         ty = bar_bottom - (max_bar_h * r)
-        draw_list.add_line(bar_x, ty, bar_x + bar_w, ty, grid_color)
-        value = max_scale * r
-        draw_list.add_text(label_x, max(ty - 7.0, y + 2.0), axis_color, format_label(value))
+        add_line(bar_x, ty, bar_x + bar_w, ty, grid_color)
+        add_text(label_x, max(ty - 7.0, y + 2.0), axis_color, label)
 
     # 레전드
     try:
@@ -677,14 +1250,14 @@ def draw_vertical_stack(draw_list, pos, size, displayed, max_scale, settings,
     order = list(STAGES)[::-1] if legend_reverse else list(STAGES)
     lx = legend_x; ly = legend_y
     for stage in order:
-        c = imgui.get_color_u32_rgba(*COLORS[stage], 1)
-        draw_list.add_rect_filled(lx, ly, lx + LEGEND_BOX, ly + LEGEND_BOX, c)
-        draw_list.add_rect(lx, ly, lx + LEGEND_BOX, ly + LEGEND_BOX, axis_color)
+        c = stage_colors[stage]
+        add_rect_filled(lx, ly, lx + LEGEND_BOX, ly + LEGEND_BOX, c)
+        add_rect(lx, ly, lx + LEGEND_BOX, ly + LEGEND_BOX, axis_color)
         try:
-            ts = imgui.calc_text_size(stage); ty = ly + (LEGEND_BOX - ts.y) / 2.0
+            ty = ly + (LEGEND_BOX - legend_text_size(stage)[1]) / 2.0
         except Exception:
             ty = ly
-        draw_list.add_text(lx + LEGEND_BOX + LEGEND_GAP, ty, axis_color, stage)
+        add_text(lx + LEGEND_BOX + LEGEND_GAP, ty, axis_color, stage)
         ly += line_h
 
     # 반환
@@ -717,25 +1290,33 @@ def draw_horizontal_bars(draw_list, pos, size, displayed, max_scale, font,
     bar_w = max(w - margin * 2, 1.0)
     bar_h = max(h - margin * 2, 1.0)
 
-    axis_color = imgui.get_color_u32_rgba(1, 1, 1, 1)
-    shadow_color = imgui.get_color_u32_rgba(0, 0, 0, 0.8)
-    grid_color = imgui.get_color_u32_rgba(0.6, 0.6, 0.6, 1)
+    axis_color = color_u32(1, 1, 1, 1)
+    shadow_color = color_u32(0, 0, 0, 0.8)
+    grid_color = color_u32(0.6, 0.6, 0.6, 1)
+    stage_colors = stage_colors_u32()
 
-    draw_list.add_rect(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, axis_color)
+    add_rect = draw_list.add_rect
+    add_rect_filled = draw_list.add_rect_filled
+    add_line = draw_list.add_line
+    add_text = draw_list.add_text
+
+    add_rect(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, axis_color)
 
     # 세로 그리드 + 상단 눈금 라벨
     label_offset = 29
-    for i in range(1, TICK_COUNT + 1):
-        r = i / float(TICK_COUNT)
+    for r, label in tick_labels(max_scale, TICK_COUNT)[1:]:
         tx = bar_x + bar_w * r
-        draw_list.add_line(tx, bar_y, tx, bar_y + bar_h, grid_color)
-        value = max_scale * r
-        draw_list.add_text(tx - 15, max(bar_y - label_offset, y + 2) - 5, axis_color, format_label(value))
+        add_line(tx, bar_y, tx, bar_y + bar_h, grid_color)
+        add_text(tx - 15, max(bar_y - label_offset, y + 2) - 5, axis_color, label)
 
     bar_count = max(len(STAGES), 1)
     bar_height = bar_h / bar_count
     panel_right = x + w - margin
 
+    # 라벨 폰트(볼드)는 막대마다가 아니라 루프 전체에 한 번만 push
+    if font is not None:
+        imgui.push_font(font)
+
     for i, stage in enumerate(STAGES):
         dur = displayed.get(stage, 0.0)
         ratio = (dur / max_scale) if max_scale > 0 else 0
@@ -746,17 +1327,11 @@ def draw_horizontal_bars(draw_list, pos, size, displayed, max_scale, font,
         rect_bottom = top + bar_height - row_gap
 
         # 바 채우기
-        color = imgui.get_color_u32_rgba(*COLORS[stage], 1)
-        draw_list.add_rect_filled(bar_x, rect_top, bar_x + bar_fill_width, rect_bottom, color)
-
-        # 폰트(볼드) 푸시
-        pushed = False
-        if font is not None:
-            imgui.push_font(font)
-            pushed = True
+        if bar_fill_width > 0.0:
+            add_rect_filled(bar_x, rect_top, bar_x + bar_fill_width, rect_bottom, stage_colors[stage])
 
         # 라벨
-        text = f"{stage}: {dur:.3f}s"
+        text = format_stage_duration(stage, dur)
         text_size = imgui.calc_text_size(text)
         text_y = top + (bar_height - text_size.y) / 2
 
@@ -794,15 +1369,42 @@ def draw_horizontal_bars(draw_list, pos, size, displayed, max_scale, font,
         alpha = st["alpha"]
         text_x = outside_x * (1.0 - alpha) + inside_x * alpha
 
-        draw_list.add_text(text_x + 1, text_y + 1, shadow_color, text)
-        draw_list.add_text(text_x, text_y, axis_color, text)
+        add_text(text_x + 1, text_y + 1, shadow_color, text)
+        add_text(text_x, text_y, axis_color, text)
 
-        if pushed:
-            imgui.pop_font()
+    if font is not None:
+        imgui.pop_font()
 
 # ------------------------------- GUI Thread -----------------------------------
 
-def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_workers: list):
+HOTKEY_FRAME_BUDGET = 8  # 프레임당 처리할 핫키 action 최대 개수
+
+SETTINGS_FILE = "settings_ui.json"
+
+# Settings 창 기본값 ("Load defaults" 가 되돌리는 값). 읽기 전용
+DEFAULT_SETTINGS = types.MappingProxyType({
+    "legend_bar_gap": 120.0,
+    "legend_right_pad": 2.0,
+    "legend_gap": 8.0,
+    "legend_box": 16.0,
+    "legend_text_ratio": 0.08,    # 레전드 텍스트 폭 비율 상한
+    "bar_width_ratio": 0.33,      # 막대 폭 비율 (0.1~0.6 추천)
+    "show_segment_pct": True,
+    "pct_digits": 1,
+    "total_x_pull": 120.0,        # Total 텍스트를 오른쪽에서 왼쪽으로 당기는 픽셀
+    "total_anchor_gap": 10.0,     # 텍스트-선 간격
+    "bend_offset": 24.0,          # 꺾임 x 오프셋
+    "f8_unbounded": True,         # ⬅️ F8 스케일: DragFloat 모드 기본 켬
+    "legend_side": "left",        # 왼쪽/오른쪽 선택 가능 ("left" / "right")
+    # Durations layout settings (사용자 조정 가능)
+    "dur_margin": 12.0,
+    "dur_row_gap": 6.0,
+    "dur_label_gap": 10.0,
+    "dur_inside_pad_x": 8.0,
+})
+
+def gui_thread(log_lines, timeline, timeline_snapshot, lock, hotkey_q: "queue.Queue[str]", hotkey_workers: list,
+               dirty: threading.Event, log_mark: list):
     global TICK_COUNT, ANIM_DURATION, LABEL_ANIM_DURATION, HEADROOM_FACTOR, SCALE_ADJUST_ALPHA
     global F8_VERTICAL_SECONDS, F8_HORIZONTAL_SECONDS, F8_ANIM_DURATION
 
@@ -816,6 +1418,10 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
 
     window = glfw.create_window(initial_width, initial_height, WINDOW_TITLE, None, None)
     glfw.make_context_current(window)
+    try:
+        glfw.swap_interval(1)  # vsync: 디스플레이 주사율 이상으로 돌지 않게
+    except Exception:
+        pass
     try:
         glfw.set_input_mode(window, glfw.STICKY_KEYS, glfw.TRUE)
     except Exception:
@@ -878,6 +1484,8 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
 
     if font_regular is None:
         font_regular = io.fonts.add_font_default()
+    # 볼드 파일이 없으면 regular 로 (Total/Durations 라벨은 항상 같은 폰트를 push)
+    font_label = font_large_bold if font_large_bold is not None else font_regular
 
     impl = GlfwRenderer(window)
     try:
@@ -899,7 +1507,25 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
     except Exception:
         pass
 
+    # framebuffer 크기는 리사이즈 때만 바뀜 -> 콜백으로 갱신하고 루프에서는 값만 읽음
+    fb_size = list(glfw.get_framebuffer_size(window))
+    prev_fb_cb = [None]
+
+    def _on_framebuffer_size(window_handle, w, h):
+        fb_size[0], fb_size[1] = w, h
+        if prev_fb_cb[0] is not None:
+            try:
+                prev_fb_cb[0](window_handle, w, h)
+            except Exception:
+                pass
+
+    try:
+        prev_fb_cb[0] = glfw.set_framebuffer_size_callback(window, _on_framebuffer_size)
+    except Exception:
+        fb_size = None  # 콜백 등록 불가 -> 매 프레임 조회
+
     no_resize_no_move_flags = imgui.WINDOW_NO_RESIZE | imgui.WINDOW_NO_MOVE
+    layout_size = None  # 마지막으로 고정 창 레이아웃을 적용한 (width, height)
 
     # 상태 변수
     displayed = {s: 0.0 for s in STAGES}
@@ -930,40 +1556,35 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
     prev_all_done = False
 
     # Settings (실시간 조정 가능한 값) + Defaults/Persistence
-    settings = {
-        "legend_bar_gap": 120.0,
-        "legend_right_pad": 2.0,
-        "legend_gap": 8.0,
-        "legend_box": 16.0,
-        "legend_text_ratio": 0.08,    # 레전드 텍스트 폭 비율 상한
-        "bar_width_ratio": 0.33,      # 막대 폭 비율 (0.1~0.6 추천)
-        "show_segment_pct": True,
-        "pct_digits": 1,
-        "total_x_pull": 120.0,        # Total 텍스트를 오른쪽에서 왼쪽으로 당기는 픽셀
-        "total_anchor_gap": 10.0,     # 텍스트-선 간격
-        "bend_offset": 24.0,          # 꺾임 x 오프셋
-        "f8_unbounded": True,         # ⬅️ F8 스케일: DragFloat 모드 기본 켬
-        "legend_side": "left",        # 왼쪽/오른쪽 선택 가능 ("left" / "right")
-        # Durations layout settings (사용자 조정 가능)
-        "dur_margin": 12.0,
-        "dur_row_gap": 6.0,
-        "dur_label_gap": 10.0,
-        "dur_inside_pad_x": 8.0,
-    }
-    DEFAULT_SETTINGS = dict(settings)
-    DEFAULT_GLOBALS = {
-        "TICK_COUNT": int(TICK_COUNT),
-        "ANIM_DURATION": float(ANIM_DURATION),
-        "LABEL_ANIM_DURATION": float(LABEL_ANIM_DURATION),
-        "HEADROOM_FACTOR": float(HEADROOM_FACTOR),
-        "SCALE_ADJUST_ALPHA": float(SCALE_ADJUST_ALPHA),
-        "F8_VERTICAL_SECONDS": F8_VERTICAL_SECONDS if F8_VERTICAL_SECONDS is None else float(F8_VERTICAL_SECONDS),
-        "F8_HORIZONTAL_SECONDS": F8_HORIZONTAL_SECONDS if F8_HORIZONTAL_SECONDS is None else float(F8_HORIZONTAL_SECONDS),
-        "F8_ANIM_DURATION": float(F8_ANIM_DURATION),
-    }
-    SETTINGS_FILE = "settings_ui.json"
+    settings = dict(DEFAULT_SETTINGS)
 
     # --- Persistence helpers ---
+    # 파일 쓰기는 렌더 스레드를 막지 않도록 전용 스레드가 순서대로 처리 (path, utf-8 bytes).
+    # None 은 종료 신호 (gui_thread 종료 시 남은 저장을 마치고 join)
+    settings_save_q: "queue.Queue[tuple[str, bytes] | None]" = queue.Queue()
+
+    def _settings_save_worker():
+        while True:
+            item = settings_save_q.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                # 임시 파일에 다 쓴 뒤 교체 -> 읽는 쪽은 이전 파일 아니면 완성된 새 파일만 봄
+                tmp = path + ".tmp"
+                try:
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, path)
+                    print(f"[settings] saved -> {os.path.abspath(path)}")
+                except Exception as e:
+                    print("[settings] save error:", e)
+            finally:
+                settings_save_q.task_done()
+
+    settings_save_thread = threading.Thread(target=_settings_save_worker, daemon=True)
+    settings_save_thread.start()
+
     def _save_settings_to_file(path: str):
         payload = {
             "settings": settings,
@@ -978,23 +1599,54 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                 "F8_ANIM_DURATION": float(F8_ANIM_DURATION),
             }
         }
+        # 직렬화는 여기서 (호출 시점 값의 스냅샷), 쓰기만 워커로 넘김
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            except Exception:
+                data = None
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            print(f"[settings] saved -> {os.path.abspath(path)}")
-            return True
+            if data is None:
+                data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
         except Exception as e:
             print("[settings] save error:", e)
             return False
+        settings_save_q.put((path, data))
+        return True
+
+    # 마지막으로 파싱한 설정 파일 (path, inode, mtime_ns, size) -> payload. 안 바뀌었으면 재파싱 생략
+    settings_file_cache = {"key": None, "payload": None}
+
+    def _read_settings_payload(path: str):
+        st = os.stat(path)
+        # os.replace 로 저장하면 inode 가 바뀜 -> mtime 해상도가 거친 FS 에서 같은 크기로
+        # 다시 저장돼도 재파싱되게 st_ino 도 key 에 포함
+        key = (os.path.abspath(path), st.st_ino, st.st_mtime_ns, st.st_size)
+        if settings_file_cache["key"] != key:
+            with open(path, "rb") as f:
+                raw = f.read()
+            payload = None
+            if orjson is not None:
+                try:
+                    payload = orjson.loads(raw)
+                except Exception:
+                    payload = None
+            if payload is None:
+                payload = json.loads(raw.decode("utf-8"))
+            settings_file_cache["payload"] = payload
+            settings_file_cache["key"] = key
+        return settings_file_cache["payload"]
 
     def _load_settings_from_file(path: str):
         # need to assign to globals -> declare
         nonlocal f8_v_anim, f8_h_anim
         global TICK_COUNT, ANIM_DURATION, LABEL_ANIM_DURATION, HEADROOM_FACTOR, SCALE_ADJUST_ALPHA
         global F8_VERTICAL_SECONDS, F8_HORIZONTAL_SECONDS, F8_ANIM_DURATION
+        # 직전에 누른 Save 가 아직 워커 큐에 있으면 디스크에 쓰일 때까지 기다린 뒤 읽음
+        settings_save_q.join()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = _read_settings_payload(path)
         except FileNotFoundError:
             print(f"[settings] not found: {path}")
             return False
@@ -1098,9 +1750,8 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
     want_focus_settings = False
 
     # 핫키 적용 함수들
-    def _apply_f8_scales():
+    def _apply_f8_scales(now_local):
         nonlocal left_scale, right_scale
-        now_local = time.time()
         if F8_VERTICAL_SECONDS is not None:
             try:
                 left_scale = float(F8_VERTICAL_SECONDS)
@@ -1116,196 +1767,204 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             except Exception as e:
                 print("[F8] failed to set horizontal scale:", e)
 
-    # CollapsingHeader 기본 오픈 플래그(버전 호환)
-    TREE_NODE_DEFAULT_OPEN = getattr(imgui, "TREE_NODE_DEFAULT_OPEN", 1 << 5)
+    # 진행 중인 스테이지/애니메이션이 없고 새 로그도 없으면 이벤트(입력/wake_gui)를 기다림
+    idle = False
+    settle_frames = GUI_SETTLE_FRAMES  # 남은 후속 프레임 수 (GUI_SETTLE_FRAMES 참고)
+
+    # summarize_durations()/summary_span() 결과 캐시 (스냅샷 객체가 바뀔 때만 재계산)
+    durations_src = None
+    closed_total, live_starts = 0.0, ()
+    first_ts, last_ts = None, None
+
+    # draw_vertical_stack 의 calc_text_size 캐시 (폰트는 시작 시 고정)
+    vstack_text_cache = {}
+
+    # Summary 행별 (dur, ratio, dur 문자열, ratio 문자열)
+    summary_cells = {}
+
+    # Total 텍스트 크기: [마지막 문자열, (w, h)] — 수렴 후에는 문자열이 그대로
+    total_text_size = [None, (0.0, 0.0)]
+
+    # Log/Summary 에서 줄·셀마다 부르는 imgui 함수는 로컬로 바인딩 (format 파싱 없는 unformatted)
+    text_unformatted = imgui.text_unformatted
+    next_column = imgui.table_next_column
 
     while not glfw.window_should_close(window):
-        glfw.poll_events()
+        # 최소화 상태: 처리할 핫키/AUTO_RESET 이 없으면 UI 빌드/렌더/swap 을 통째로 건너뛴다
+        # (큐에 뭔가 있으면 표시 상태 리셋이 밀리지 않도록 평소처럼 프레임을 돈다)
+        if hotkey_q.empty() and glfw.get_window_attrib(window, glfw.ICONIFIED):
+            glfw.wait_events_timeout(GUI_IDLE_WAIT)
+            continue
+        if idle and not dirty.is_set():
+            glfw.wait_events_timeout(GUI_IDLE_WAIT)
+        else:
+            glfw.poll_events()
+        frame_activity = dirty.is_set()
+        dirty.clear()
         impl.process_inputs()
         imgui.new_frame()
 
         if font_regular is not None:
             imgui.push_font(font_regular)
 
+        # 프레임 시각은 한 번만 읽어 핫키 처리/애니메이션/라벨에 공통으로 사용
+        now = time.time()
+
         # process global hotkey queue (non-blocking, evdev-only)
-        try:
-            while True:
+        # 프레임당 처리 개수 상한 -> 키 입력 폭주에도 프레임 시간이 일정. 남은 건 다음 프레임에
+        for _ in range(HOTKEY_FRAME_BUDGET):
+            try:
                 action = hotkey_q.get_nowait()
-                if action == "RESET":
-                    # --- 타임라인/로그 초기화 (manual F10) ---
-                    with lock:
-                        for stage in STAGES:
-                            timeline[stage]["start"] = None
-                            timeline[stage]["end"] = None
-                        log_lines.clear()
-                    for s in STAGES:
-                        displayed[s] = 0.0
-                        anim_state[s]["running"] = False
-
-                    # --- F8 프리셋으로 스케일 초기화(0.5 step, 범위 Clamp) ---
-                    def _q05_in_range(x, lo, hi):
-                        if x is None:
-                            return None
-                        try:
-                            v = round(float(x) * 2.0) / 2.0  # 0.5 단위
-                            if lo is not None: v = max(lo, v)
-                            if hi is not None: v = min(hi, v)
-                            return v
-                        except Exception:
-                            return None
-
-                    _ls = _q05_in_range(F8_VERTICAL_SECONDS,   1.0, 60.0)
-                    _rs = _q05_in_range(F8_HORIZONTAL_SECONDS, 1.0, 40.0)
-
-                    # F8 값이 없으면 기존 스케일 유지 (이전처럼 고정 5.0 사용 안 함)
-                    left_scale  = float(_ls if _ls is not None else left_scale)
-                    right_scale = float(_rs if _rs is not None else right_scale)
-
-                    # 표시 스케일도 바로 동기화
-                    displayed_left_scale = float(left_scale)
-                    displayed_right_scale = float(right_scale)
-                    displayed_total = 0.0
-
-                    # 애니메이션/라벨 상태 리셋
-                    f8_v_anim.update({"active": False, "t0": 0.0, "from": float(left_scale),  "dur": float(F8_ANIM_DURATION)})
-                    f8_h_anim.update({"active": False, "t0": 0.0, "from": float(right_scale), "dur": float(F8_ANIM_DURATION)})
-                    for s in STAGES:
-                        label_anim[s].update({"alpha": 0.0, "active": False, "t0": 0.0, "from": 0.0, "to": 0.0, "target": 0.0})
-                    total_anim.update({"active": False, "t0": 0.0, "alpha": 0.0})
-                    prev_all_done = False
-
-                    print(f"[reset] scales <- F8 presets | left={left_scale:.1f}s, right={right_scale:.1f}s")
-                elif action == "AUTO_RESET":
-                    # AUTO_RESET: start-pattern 감지로 자동 초기화 + 첫 스테이지 시작
-                    # (단, 방금 감지된 로그 라인(마지막 항목)은 보존한다)
-                    with lock:
-                        # 보존할 마지막 로그 라인 캡처
-                        preserved = None
-                        try:
-                            if log_lines:
-                                preserved = log_lines[-1]
-                        except Exception:
-                            preserved = None
-
-                        # 타임라인 초기화
-                        for stage in STAGES:
-                            timeline[stage]["start"] = None
-                            timeline[stage]["end"] = None
-
-                        # 로그는 초기화하되, 마지막(감지된) 라인은 복원
-                        log_lines.clear()
-                        if preserved is not None:
-                            log_lines.append(preserved)
-
-                    # displayed / anim 초기화
-                    for s in STAGES:
-                        displayed[s] = 0.0
-                        anim_state[s]["running"] = False
-
-                    # 0.5 단위 양자화 헬퍼 (범위 클램프 포함)
-                    def _q05_in_range(x, lo, hi):
-                        if x is None:
-                            return None
-                        try:
-                            v = round(float(x) * 2.0) / 2.0  # 0.5 단위
-                            if lo is not None: v = max(lo, v)
-                            if hi is not None: v = min(hi, v)
-                            return v
-                        except Exception:
-                            return None
-
-                    _ls = _q05_in_range(F8_VERTICAL_SECONDS,   1.0, 60.0)
-                    _rs = _q05_in_range(F8_HORIZONTAL_SECONDS, 1.0, 40.0)
+            except queue.Empty:
+                break
+            frame_activity = True
+            if action == "RESET":
+                # --- 타임라인/로그 초기화 (manual F10) ---
+                with lock:
+                    reset_timeline(timeline)
+                    publish_timeline(timeline, timeline_snapshot)
+                    log_lines.clear()
+                    log_mark[0] = None
+                for s in STAGES:
+                    displayed[s] = 0.0
+                    anim_state[s]["running"] = False
+
+                # --- F8 프리셋으로 스케일 초기화(0.5 step, 범위 Clamp) ---
+                _ls = _q05_in_range(F8_VERTICAL_SECONDS,   F8_LEFT_MIN, F8_LEFT_MAX)
+                _rs = _q05_in_range(F8_HORIZONTAL_SECONDS, F8_RIGHT_MIN, F8_RIGHT_MAX)
+
+                # F8 값이 없으면 기존 스케일 유지 (이전처럼 고정 5.0 사용 안 함)
+                left_scale  = float(_ls if _ls is not None else left_scale)
+                right_scale = float(_rs if _rs is not None else right_scale)
+
+                # 표시 스케일도 바로 동기화
+                displayed_left_scale = float(left_scale)
+                displayed_right_scale = float(right_scale)
+                displayed_total = 0.0
+
+                # 애니메이션/라벨 상태 리셋
+                f8_v_anim.update({"active": False, "t0": 0.0, "from": float(left_scale),  "dur": float(F8_ANIM_DURATION)})
+                f8_h_anim.update({"active": False, "t0": 0.0, "from": float(right_scale), "dur": float(F8_ANIM_DURATION)})
+                for s in STAGES:
+                    label_anim[s].update({"alpha": 0.0, "active": False, "t0": 0.0, "from": 0.0, "to": 0.0, "target": 0.0})
+                total_anim.update({"active": False, "t0": 0.0, "alpha": 0.0})
+                prev_all_done = False
+
+                print(f"[reset] scales <- F8 presets | left={left_scale:.1f}s, right={right_scale:.1f}s")
+            elif action == "AUTO_RESET":
+                # AUTO_RESET: start-pattern 감지로 표시 상태 초기화
+                # (타임라인 초기화 + 첫 스테이지 시작은 log_thread 가 라인 순서대로 이미 적용)
+
+                # 로그는 감지된 start 라인(log_mark) 앞까지만 지운다 -> start 라인과
+                # 그 뒤에 들어온 라인은 남음. mark 가 있는 동안 log_thread 는 lock 을 잡고
+                # append 하므로 여기서도 lock 안에서 정리. mark 가 None 이면 이미 maxlen 으로
+                # 밀려난 것이라 남은 라인은 모두 start 이후
+                with lock:
+                    mark = log_mark[0]
+                    if mark is not None:
+                        while len(log_lines) > 1 and log_lines[0] is not mark:
+                            log_lines.popleft()
+                        log_mark[0] = None
 
-                    left_scale  = float(_ls if _ls is not None else left_scale)
-                    right_scale = float(_rs if _rs is not None else right_scale)
+                # displayed / anim 초기화
+                for s in STAGES:
+                    displayed[s] = 0.0
+                    anim_state[s]["running"] = False
 
-                    displayed_left_scale = float(left_scale)
-                    displayed_right_scale = float(right_scale)
-                    displayed_total = 0.0
+                # 0.5 단위 양자화 (범위 클램프 포함)
+                _ls = _q05_in_range(F8_VERTICAL_SECONDS,   F8_LEFT_MIN, F8_LEFT_MAX)
+                _rs = _q05_in_range(F8_HORIZONTAL_SECONDS, F8_RIGHT_MIN, F8_RIGHT_MAX)
 
-                    f8_v_anim.update({"active": False, "t0": 0.0, "from": float(left_scale),  "dur": float(F8_ANIM_DURATION)})
-                    f8_h_anim.update({"active": False, "t0": 0.0, "from": float(right_scale), "dur": float(F8_ANIM_DURATION)})
-                    for s in STAGES:
-                        label_anim[s].update({"alpha": 0.0, "active": False, "t0": 0.0, "from": 0.0, "to": 0.0, "target": 0.0})
-                    total_anim.update({"active": False, "t0": 0.0, "alpha": 0.0})
-                    prev_all_done = False
+                left_scale  = float(_ls if _ls is not None else left_scale)
+                right_scale = float(_rs if _rs is not None else right_scale)
 
-                    # 자동 시작: 첫 스테이지 start 바로 세팅
-                    with lock:
-                        if STAGES:
-                            timeline[STAGES[0]]["start"] = time.time()
-
-                    print(f"[auto] start-pattern detected -> reset & start | left={left_scale:.1f}s, right={right_scale:.1f}s")
-                elif action == "SPAWN_SEQ":
-                    print("[hotkeys] F2 pressed -> spawn test sequence")
-                    spawn_test_sequence(LOG_FILE, total_sec=5.0)
-                elif action == "SET_F8_SCALES":
-                    _apply_f8_scales()
-                elif action == "TOGGLE_SETTINGS":
-                    settings_visible = not settings_visible
-                    if settings_visible:
-                        want_focus_settings = True
-                    print(f"[hotkeys] Settings {'shown' if settings_visible else 'hidden'} (evdev/glfw)")
-        except queue.Empty:
-            pass
-
-        now = time.time()
-        width, height = glfw.get_framebuffer_size(window)
+                displayed_left_scale = float(left_scale)
+                displayed_right_scale = float(right_scale)
+                displayed_total = 0.0
+
+                f8_v_anim.update({"active": False, "t0": 0.0, "from": float(left_scale),  "dur": float(F8_ANIM_DURATION)})
+                f8_h_anim.update({"active": False, "t0": 0.0, "from": float(right_scale), "dur": float(F8_ANIM_DURATION)})
+                for s in STAGES:
+                    label_anim[s].update({"alpha": 0.0, "active": False, "t0": 0.0, "from": 0.0, "to": 0.0, "target": 0.0})
+                total_anim.update({"active": False, "t0": 0.0, "alpha": 0.0})
+                prev_all_done = False
+
+                print(f"[auto] start-pattern detected -> reset & start | left={left_scale:.1f}s, right={right_scale:.1f}s")
+            elif action == "SPAWN_SEQ":
+                print("[hotkeys] F2 pressed -> spawn test sequence")
+                spawn_test_sequence(LOG_FILE, total_sec=5.0)
+            elif action == "SET_F8_SCALES":
+                _apply_f8_scales(now)
+            elif action == "TOGGLE_SETTINGS":
+                settings_visible = not settings_visible
+                if settings_visible:
+                    want_focus_settings = True
+                print(f"[hotkeys] Settings {'shown' if settings_visible else 'hidden'} (evdev/glfw)")
+
+        if fb_size is not None:
+            width, height = fb_size
+        else:
+            width, height = glfw.get_framebuffer_size(window)
         half_w = width / 2
         half_h = height / 2
+        # 고정(NO_MOVE/NO_RESIZE) 창은 framebuffer 크기가 바뀔 때만 위치/크기를 다시 지정.
+        # Log/Summary 는 사용자가 끌어도 제자리로 돌아오도록 매 프레임 지정(기존 동작 유지)
+        relayout = (width, height) != layout_size
+        if relayout:
+            layout_size = (width, height)
 
-        with lock:
-            timeline_copy = {s: dict(timeline[s]) for s in STAGES}
+        # writer 가 통째로 교체하는 불변 스냅샷 -> lock/복사 없이 읽기
+        timeline_copy = timeline_snapshot[0]
 
         # 완료 여부
-        all_done = all(timeline_copy[s].get("start") and timeline_copy[s].get("end") for s in STAGES)
+        all_done = all(timeline_copy[s][0] and timeline_copy[s][1] for s in STAGES)
 
-        # targets
-        targets = {}
-        for s in STAGES:
-            start = timeline_copy[s].get("start")
-            end = timeline_copy[s].get("end")
-            if start is None:
-                targets[s] = 0.0
-            elif end is None:
-                targets[s] = max(0.0, now - start)
-                anim_state[s]["running"] = False
-            else:
-                targets[s] = max(0.0, end - start)
-                if not anim_state[s]["running"] and displayed[s] < targets[s] - 1e-6:
-                    anim_state[s]["running"] = True
-                    anim_state[s]["start_t"] = now
-                    anim_state[s]["from"] = displayed[s]
-                    anim_state[s]["to"] = targets[s]
-
-        # update displayed
+        # targets + displayed: 스테이지당 한 번 순회하면서 합/최대도 같이 누적
+        # (스테이지 수가 한 자릿수라 배열 연산보다 단일 Python 루프가 싸다)
+        anim_dur = max(ANIM_DURATION, 1e-9)
+        displayed_sum = 0.0
+        displayed_max = 0.0
         for s in STAGES:
-            start = timeline_copy[s].get("start")
-            end = timeline_copy[s].get("end")
+            start, end = timeline_copy[s]
+            st = anim_state[s]
             if start is None:
-                displayed[s] = 0.0
-                anim_state[s]["running"] = False
+                val = 0.0
+                st["running"] = False
             elif end is None:
-                displayed[s] = targets[s]
+                val = max(0.0, now - start)
+                st["running"] = False
             else:
-                if anim_state[s]["running"]:
-                    t0 = anim_state[s]["start_t"]
-                    frac = (now - t0) / max(ANIM_DURATION, 1e-9)
+                target = max(0.0, end - start)
+                if not st["running"] and displayed[s] < target - 1e-6:
+                    st["running"] = True
+                    st["start_t"] = now
+                    st["from"] = displayed[s]
+                    st["to"] = target
+                if st["running"]:
+                    frac = (now - st["start_t"]) / anim_dur
                     if frac >= 1.0:
-                        displayed[s] = anim_state[s]["to"]
-                        anim_state[s]["running"] = False
+                        val = st["to"]
+                        st["running"] = False
                     else:
                         eased = 1 - (1 - frac) ** 3
-                        displayed[s] = anim_state[s]["from"] + (anim_state[s]["to"] - anim_state[s]["from"]) * eased
+                        val = st["from"] + (st["to"] - st["from"]) * eased
                 else:
-                    displayed[s] = targets[s]
+                    val = target
+            displayed[s] = val
+            displayed_sum += val
+            if val > displayed_max:
+                displayed_max = val
 
         # dynamic scales
-        durations_now = compute_durations(timeline_copy)
-        target_total = sum(durations_now.values())
-        needed_left = max(sum(displayed.values()), target_total, 1e-9)
-        needed_right = max(max(displayed.values()) if displayed else 1.0, 1e-9)
+        if timeline_copy is not durations_src:
+            durations_src = timeline_copy
+            closed_total, live_starts = summarize_durations(timeline_copy)
+            first_ts, last_ts = summary_span(timeline_copy)
+        target_total = closed_total
+        for st in live_starts:
+            target_total += max(0.0, now - st)
+        needed_left = max(displayed_sum, target_total, 1e-9)
+        needed_right = max(displayed_max if STAGES else 1.0, 1e-9)
 
         if needed_left > left_scale * 0.999999:
             left_scale = closer_nice_max(needed_left)
@@ -1321,7 +1980,7 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             else:
                 displayed_left_scale = f8_v_anim["from"] + (left_scale - f8_v_anim["from"]) * ease_out_cubic(t)
         else:
-            displayed_left_scale += (left_scale - displayed_left_scale) * SCALE_ADJUST_ALPHA
+            displayed_left_scale = smooth_toward(displayed_left_scale, left_scale, SCALE_ADJUST_ALPHA)
 
         if f8_h_anim["active"]:
             t = (now - f8_h_anim["t0"]) / max(f8_h_anim["dur"], 1e-9)
@@ -1331,11 +1990,11 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             else:
                 displayed_right_scale = f8_h_anim["from"] + (right_scale - f8_h_anim["from"]) * ease_out_cubic(t)
         else:
-            displayed_right_scale += (right_scale - displayed_right_scale) * SCALE_ADJUST_ALPHA
+            displayed_right_scale = smooth_toward(displayed_right_scale, right_scale, SCALE_ADJUST_ALPHA)
 
         # animated total number
-        needed_total = sum(displayed.values())
-        displayed_total += (needed_total - displayed_total) * SCALE_ADJUST_ALPHA
+        needed_total = displayed_sum
+        displayed_total = smooth_toward(displayed_total, needed_total, SCALE_ADJUST_ALPHA)
 
         # --- UI ---
         imgui.push_style_color(imgui.COLOR_TITLE_BACKGROUND, *highlight_color)
@@ -1346,13 +2005,28 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
         imgui.set_next_window_position(0, 0)
         imgui.set_next_window_size(half_w, half_h)
         imgui.begin("Log", False)
-        with lock:
-            lines_snapshot = list(log_lines)
+        # 복사 없이 인덱스로 읽는다. 동시에 일어날 수 있는 변경은 log_thread 의 append
+        # (maxlen 도달 시 popleft 포함) 뿐이라 길이가 줄지 않으므로 IndexError 없음.
+        # (deque 순회/islice 는 순회 중 append 되면 RuntimeError)
+        n_lines = len(log_lines)
         imgui.begin_child("log_child", 0, 0, border=True)
         imgui.push_style_var(imgui.STYLE_ITEM_SPACING, (0, 0))
-        for line in lines_snapshot:
-            imgui.text_unformatted(line)
-        if lines_snapshot:
+        # 수동 clipping (pyimgui 2.0 에는 ListClipper 바인딩이 없음): item spacing 0 이라
+        # 줄 높이가 일정 -> 스크롤 위치로 보이는 범위만 submit, 나머지 높이는 dummy 로 예약
+        line_h = imgui.get_text_line_height()
+        if line_h > 0:
+            scroll_y = imgui.get_scroll_y()
+            first = min(n_lines, max(0, int(scroll_y / line_h) - 1))
+            last = min(n_lines, int((scroll_y + imgui.get_window_height()) / line_h) + 2)
+        else:
+            first, last = 0, n_lines
+        if first > 0:
+            imgui.dummy(0, first * line_h)
+        for i in range(first, last):
+            text_unformatted(format_log_entry(log_lines[i]))
+        if last < n_lines:
+            imgui.dummy(0, (n_lines - last) * line_h)
+        if n_lines:
             try:
                 imgui.set_scroll_here_y(1.0)
             except Exception:
@@ -1376,11 +2050,10 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             imgui.table_setup_column("Duration")
             imgui.table_setup_column("Ratio")
             imgui.table_headers_row()
-            total_for_ratio = sum(displayed.values()) or 1.0
+            total_for_ratio = displayed_sum or 1.0
 
             for stage in STAGES:
-                sstart = timeline_copy[stage].get("start")
-                send   = timeline_copy[stage].get("end")
+                sstart, send = timeline_copy[stage]
                 if sstart and send:
                     dur = max(0.0, send - sstart)
                 elif sstart and not send:
@@ -1389,35 +2062,37 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                     dur = 0.0
                 ratio = (dur / total_for_ratio) * 100.0
 
+                # 끝난 스테이지는 값이 그대로라 지난 프레임 문자열을 재사용
+                cell = summary_cells.get(stage)
+                if cell is None or cell[0] != dur or cell[1] != ratio:
+                    cell = summary_cells[stage] = (dur, ratio, f"{dur:.2f}s", f"{ratio:.1f}%")
+
                 imgui.table_next_row()
-                imgui.table_next_column(); imgui.text(stage)
-                imgui.table_next_column(); imgui.text(fmt_hms_hundredths(sstart))
-                imgui.table_next_column(); imgui.text(fmt_hms_hundredths(send))
-                imgui.table_next_column(); imgui.text(f"{dur:.2f}s")
-                imgui.table_next_column(); imgui.text(f"{ratio:.1f}%")
+                next_column(); text_unformatted(stage)
+                next_column(); text_unformatted(fmt_hms_hundredths(sstart))
+                next_column(); text_unformatted(fmt_hms_hundredths(send))
+                next_column(); text_unformatted(cell[2])
+                next_column(); text_unformatted(cell[3])
 
             # TOTAL
+            # (모두 끝났으면 total = closed_total; start/end 는 스냅샷당 한 번 계산해 둔 값)
             if all_done:
-                total_dur = sum((timeline_copy[s]["end"] - timeline_copy[s]["start"]) for s in STAGES)
-                starts = [timeline_copy[s]["start"] for s in STAGES if timeline_copy[s].get("start")]
-                ends   = [timeline_copy[s]["end"]   for s in STAGES if timeline_copy[s].get("end")]
-                first_ts = min(starts) if starts else None
-                last_ts  = max(ends)   if ends   else None
-
+                total_dur = closed_total
                 imgui.table_next_row()
                 imgui.push_style_color(imgui.COLOR_TEXT, *final_row_color)
-                imgui.table_next_column(); imgui.text("TOTAL")
-                imgui.table_next_column(); imgui.text(fmt_hms_hundredths(first_ts))
-                imgui.table_next_column(); imgui.text(fmt_hms_hundredths(last_ts))
-                imgui.table_next_column(); imgui.text(f"{total_dur:.2f}s")
-                imgui.table_next_column(); imgui.text("100.0%")
+                next_column(); text_unformatted("TOTAL")
+                next_column(); text_unformatted(fmt_hms_hundredths(first_ts))
+                next_column(); text_unformatted(fmt_hms_hundredths(last_ts))
+                next_column(); text_unformatted(f"{total_dur:.2f}s")
+                next_column(); text_unformatted("100.0%")
                 imgui.pop_style_color()
             imgui.end_table()
         imgui.end()
 
         # Total (bottom-left)
-        imgui.set_next_window_position(0, half_h)
-        imgui.set_next_window_size(half_w, half_h)
+        if relayout:
+            imgui.set_next_window_position(0, half_h)
+            imgui.set_next_window_size(half_w, half_h)
         imgui.begin("Total", False, no_resize_no_move_flags)
         avail_w, avail_h = get_content_region_avail_safe()
         draw_list = imgui.get_window_draw_list()
@@ -1433,13 +2108,13 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             displayed, displayed_left_scale, settings,
             legend_side=settings.get("legend_side", "left"),
             legend_align="center",
-            legend_reverse=True
+            legend_reverse=True,
+            text_cache=vstack_text_cache
         )
 
         # 2) Total 페이드인 트리거/리셋
-        now_ts = time.time()
         if all_done and not prev_all_done:
-            total_anim.update({"active": True, "t0": now_ts})
+            total_anim.update({"active": True, "t0": now})
             prev_all_done = True
         elif not all_done:
             total_anim.update({"active": False, "alpha": 0.0})
@@ -1448,7 +2123,7 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
         # 3) 알파 업데이트
         alpha = total_anim["alpha"]
         if total_anim["active"]:
-            t = (now_ts - total_anim["t0"]) / max(total_anim["dur"], 1e-9)
+            t = (now - total_anim["t0"]) / max(total_anim["dur"], 1e-9)
             if t >= 1.0:
                 alpha = 1.0
                 total_anim["active"] = False
@@ -1459,11 +2134,15 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
         # 4) 완료 상태에서만 Total + 연결선 표시
         if alpha > 0.0:
             total_text = f"Total: {displayed_total:.2f}s"
-            try:
-                text_size = imgui.calc_text_size(total_text, False, -1)
-                text_w, text_h = float(text_size.x), float(text_size.y)
-            except Exception:
-                text_w, text_h = (len(total_text) * 8.0), 16.0
+            if total_text_size[0] == total_text:
+                text_w, text_h = total_text_size[1]
+            else:
+                try:
+                    text_size = imgui.calc_text_size(total_text, False, -1)
+                    text_w, text_h = float(text_size.x), float(text_size.y)
+                    total_text_size[0], total_text_size[1] = total_text, (text_w, text_h)
+                except Exception:
+                    text_w, text_h = (len(total_text) * 8.0), 16.0
 
             TOTAL_X_PULL = float(settings.get("total_x_pull", 120.0))
             TOTAL_ANCHOR_GAP = float(settings.get("total_anchor_gap", 10.0))
@@ -1482,8 +2161,8 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                 bend_x = min(tip_x + BEND_OFFSET, anchor_x - 6.0)
                 bend_y = anchor_y
 
-                line_col = imgui.get_color_u32_rgba(1, 1, 1, 0.6 * alpha)
-                dot_col  = imgui.get_color_u32_rgba(1, 1, 1, 0.85 * alpha)
+                line_col = faded_color_u32(1, 1, 1, 0.6, alpha)
+                dot_col  = faded_color_u32(1, 1, 1, 0.85, alpha)
 
                 draw_list.add_line(tip_x,  tip_y, bend_x, bend_y, line_col, 1.6)
                 draw_list.add_line(bend_x, bend_y, anchor_x, anchor_y, line_col, 1.6)
@@ -1492,22 +2171,17 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                 except Exception:
                     pass
 
-            bold_pushed = False
-            if font_large_bold is not None:
-                imgui.push_font(font_large_bold)
-                bold_pushed = True
-
-            draw_list.add_text(tx + 1, ty + 1, imgui.get_color_u32_rgba(0, 0, 0, 0.7 * alpha), total_text)
-            draw_list.add_text(tx, ty, imgui.get_color_u32_rgba(1, 1, 1, alpha), total_text)
-
-            if bold_pushed:
-                imgui.pop_font()
+            imgui.push_font(font_label)
+            draw_list.add_text(tx + 1, ty + 1, faded_color_u32(0, 0, 0, 0.7, alpha), total_text)
+            draw_list.add_text(tx, ty, faded_color_u32(1, 1, 1, 1.0, alpha), total_text)
+            imgui.pop_font()
 
         imgui.end()
 
         # Durations (bottom-right)
-        imgui.set_next_window_position(half_w, half_h)
-        imgui.set_next_window_size(half_w, half_h)
+        if relayout:
+            imgui.set_next_window_position(half_w, half_h)
+            imgui.set_next_window_size(half_w, half_h)
         imgui.begin("Durations", False, no_resize_no_move_flags)
         avail_w, avail_h = get_content_region_avail_safe()
         draw_list = imgui.get_window_draw_list()
@@ -1515,8 +2189,8 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
         draw_horizontal_bars(
             draw_list, pos, (avail_w, avail_h),
             displayed, displayed_right_scale,
-            font_large_bold,
-            label_anim, time.time(), LABEL_ANIM_DURATION,
+            font_label,
+            label_anim, now, LABEL_ANIM_DURATION,
             settings=settings
         )
         imgui.end()
@@ -1534,29 +2208,6 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             # X(닫기 버튼) 제거: closable=False 로 호출
             imgui.begin("Settings", False, flags)
 
-            # ---- (버전 호환) 섹션 시작/종료 래퍼 ----
-            TREE_NODE_DEFAULT_OPEN = getattr(imgui, "TREE_NODE_DEFAULT_OPEN", 1 << 5)
-
-            def begin_section(label: str, default_open: bool = True):
-                fl = TREE_NODE_DEFAULT_OPEN if default_open else 0
-                if hasattr(imgui, "tree_node_ex"):
-                    # 신버전: bool 하나 반환
-                    opened = bool(imgui.tree_node_ex(label, fl))
-                    return opened, True   # True => 나중에 tree_pop 필요
-                else:
-                    # 구버전: collapsing_header 가 (expanded, visible) 튜플을 반환할 수 있음
-                    try:
-                        res = imgui.collapsing_header(label, flags=fl)
-                    except TypeError:
-                        res = imgui.collapsing_header(label)
-                    opened = res[0] if isinstance(res, tuple) else bool(res)
-                    return opened, False  # False => tree_pop 불필요
-
-            def end_section(need_pop: bool):
-                if need_pop and hasattr(imgui, "tree_pop"):
-                    imgui.tree_pop()
-            # --------------------------------------
-
             # Layout
             opened, pop = begin_section("Layout / Legend / Bar", True)
             if opened:
@@ -1635,13 +2286,6 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
             # F8 preset scales (0.5-step)
             opened, pop = begin_section("F8 Scales (Exact Seconds)", True)
             if opened:
-                # 0.5 단위 양자화 헬퍼
-                def _q05(x: float) -> float:
-                    try:
-                        return round(float(x) * 2.0) / 2.0
-                    except Exception:
-                        return 0.0
-
                 # 모드 선택: 제한 없는 DragFloat vs 범위 지정 Slider
                 changed, settings["f8_unbounded"] = imgui.checkbox(
                     "Unbounded (use DragFloat)", settings.get("f8_unbounded", False)
@@ -1670,15 +2314,15 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                     lval = F8_VERTICAL_SECONDS if isinstance(F8_VERTICAL_SECONDS, (int, float)) else float(displayed_left_scale)
                     rval = F8_HORIZONTAL_SECONDS if isinstance(F8_HORIZONTAL_SECONDS, (int, float)) else float(displayed_right_scale)
 
-                    ch, lval = imgui.slider_float("Left scale seconds", float(lval), 1.0, 60.0, "%.1f")
+                    ch, lval = imgui.slider_float("Left scale seconds", float(lval), F8_LEFT_MIN, F8_LEFT_MAX, "%.1f")
                     if ch:
                         lval = _q05(lval)
-                        F8_VERTICAL_SECONDS = min(60.0, max(1.0, lval))
+                        F8_VERTICAL_SECONDS = min(F8_LEFT_MAX, max(F8_LEFT_MIN, lval))
 
-                    ch, rval = imgui.slider_float("Right scale seconds", float(rval), 1.0, 40.0, "%.1f")
+                    ch, rval = imgui.slider_float("Right scale seconds", float(rval), F8_RIGHT_MIN, F8_RIGHT_MAX, "%.1f")
                     if ch:
                         rval = _q05(rval)
-                        F8_HORIZONTAL_SECONDS = min(40.0, max(1.0, rval))
+                        F8_HORIZONTAL_SECONDS = min(F8_RIGHT_MAX, max(F8_RIGHT_MIN, rval))
 
                 # 애니메이션 시간은 자유(스텝 제한 없음)
                 changed, v = imgui.slider_float("F8 anim duration (s)", float(F8_ANIM_DURATION), 0.05, 2.0, "%.2f")
@@ -1688,7 +2332,7 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
                     f8_h_anim["dur"] = float(F8_ANIM_DURATION)
 
                 if imgui.button("Apply now"):
-                    _apply_f8_scales()
+                    _apply_f8_scales(now)
                 imgui.same_line()
                 if hasattr(imgui, "text_disabled"):
                     imgui.text_disabled("(apply F8 preset scales)")
@@ -1722,24 +2366,54 @@ def gui_thread(log_lines, timeline, lock, hotkey_q: "queue.Queue[str]", hotkey_w
         impl.render(imgui.get_draw_data())
         glfw.swap_buffers(window)
 
+        # 이번 프레임에 입력(마우스 이동/버튼/휠, 활성 위젯)이나 새 데이터가 있었으면
+        # 후속 프레임 카운터를 채우고, 없으면 하나씩 소진
+        mouse_delta = io.mouse_delta
+        if (frame_activity or mouse_delta.x or mouse_delta.y or io.mouse_wheel
+                or any(io.mouse_down) or imgui.is_any_item_active()):
+            settle_frames = GUI_SETTLE_FRAMES
+        elif settle_frames:
+            settle_frames -= 1
+
+        # 다음 프레임 idle 판정 (스케일/Total 스무딩이 수렴했는지도 포함)
+        busy = (
+            settle_frames > 0
+            or any(timeline_copy[s][0] and timeline_copy[s][1] is None for s in STAGES)
+            or any(anim_state[s]["running"] or label_anim[s]["active"] for s in STAGES)
+            or f8_v_anim["active"] or f8_h_anim["active"] or total_anim["active"]
+            or left_scale != displayed_left_scale
+            or right_scale != displayed_right_scale
+            or needed_total != displayed_total
+            or not hotkey_q.empty()
+        )
+        idle = not busy
+
+    # 대기 중인 설정 저장을 마치고 종료 (daemon 스레드라 join 없이는 유실될 수 있음)
+    settings_save_q.put(None)
+    settings_save_thread.join()
+
     impl.shutdown()
     glfw.terminate()
 
 # ------------------------------- Main -----------------------------------------
 
 def main():
-    log_lines = deque(maxlen=1000)
+    log_lines = deque(maxlen=1000)  # (ts "%H:%M:%S", line) — format_log_entry() 로 표시
     timeline = {stage: {"start": None, "end": None} for stage in STAGES}
+    timeline_snapshot = [None]  # publish_timeline() 이 채우는 GUI 용 불변 스냅샷 슬롯
+    publish_timeline(timeline, timeline_snapshot)
     lock = threading.Lock()
+    dirty = threading.Event()  # log_thread -> GUI: 새 로그/타임라인 변화
+    log_mark = [None]  # log_thread -> GUI: AUTO_RESET 때 남길 start 라인 항목
 
     # start hotkey monitor
     hotkey_q, workers = start_hotkey_queue()
 
     # pass hotkey_q/control_q to log_thread so it can emit AUTO_RESET on start-pattern
-    t = threading.Thread(target=log_thread, args=(log_lines, timeline, lock, hotkey_q), daemon=True)
+    t = threading.Thread(target=log_thread, args=(log_lines, timeline, timeline_snapshot, lock, hotkey_q, dirty, log_mark), daemon=True)
     t.start()
 
-    gui_thread(log_lines, timeline, lock, hotkey_q, workers)
+    gui_thread(log_lines, timeline, timeline_snapshot, lock, hotkey_q, workers, dirty, log_mark)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+classify_line() 결과가 패턴별 re.search 기준(우선순위 순 첫 매칭)과 같은지 확인.
+경로별로: combined regex(lookahead/lastgroup), 필수 문자열 prefilter, 고정 문자열 'in',
+Aho-Corasick, Hyperscan DB (optional 모듈이 설치돼 있을 때).
+"""
+
+import importlib
+import os
+import re
+import sys
+
+import pytest
+
+pytest.importorskip("glfw")
+pytest.importorskip("imgui")
+
+# "[[:alpha:]]" 는 re 에서 FutureWarning(nested set) -> 의도된 입력
+pytestmark = pytest.mark.filterwarnings("ignore:Possible nested set:FutureWarning")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# re 와 Hyperscan 이 다르게 읽는 구문 + 평범한 regex
+DIVERGENT = ["[[:alpha:]]x", "ab{,2}c"]
+PLAIN = [r"Starting kernel \.\.\.", r"Rootfs start\d", r"login:\s*$"]
+LINES = [
+    "ax", "ac", "abbc", "abbbc", ":x", "a]x",
+    "Starting kernel ...", "Rootfs start3", "s32g399ardb3 login:",
+    "NOTICE:  Reset status: Power-On Reset", "nothing here", "",
+]
+
+
+@pytest.fixture(scope="module")
+def main_mod():
+    argv = sys.argv
+    sys.argv = ["main.py", "--config", os.path.join(ROOT, "config.json")]
+    sys.path.insert(0, ROOT)
+    try:
+        yield importlib.import_module("main")
+    finally:
+        sys.argv = argv
+        sys.path.remove(ROOT)
+
+
+def _entries(patterns):
+    return [(re.compile(p, re.ASCII), ("stage", f"S{i}", "start", None)) for i, p in enumerate(patterns)]
+
+
+def _reference(entries, line):
+    for rx, info in entries:
+        if rx.search(line):
+            return info
+    return None
+
+
+def _use_entries(monkeypatch, main_mod, entries, hs_db=None, classify_re=None, groups=None,
+                 automaton=None, literal_entries=None, prefilter=None):
+    # 주어진 fast path 만 켜고 나머지는 끈 상태로 분류
+    monkeypatch.setattr(main_mod, "CLASSIFY_ENTRIES", entries)
+    monkeypatch.setattr(main_mod, "CLASSIFY_AUTOMATON", automaton)
+    monkeypatch.setattr(main_mod, "CLASSIFY_LITERAL_ENTRIES", literal_entries)
+    monkeypatch.setattr(main_mod, "PREFILTER_LITERALS", prefilter)
+    monkeypatch.setattr(main_mod, "CLASSIFY_RE", classify_re)
+    monkeypatch.setattr(main_mod, "CLASSIFY_GROUPS", groups or {})
+    monkeypatch.setattr(main_mod, "CLASSIFY_HS_DB", hs_db)
+
+
+def _assert_same_as_reference(main_mod, entries, lines):
+    for line in lines:
+        assert main_mod.classify_line(line) == _reference(entries, line), line
+
+
+@pytest.mark.parametrize("patterns", [DIVERGENT, PLAIN, DIVERGENT + PLAIN, PLAIN + DIVERGENT])
+def test_classify_matches_re_reference(monkeypatch, main_mod, patterns):
+    entries = _entries(patterns)
+    _use_entries(monkeypatch, main_mod, entries, hs_db=main_mod.build_hyperscan_db(rx for rx, _ in entries))
+    _assert_same_as_reference(main_mod, entries, LINES)
+
+
+def test_hyperscan_db_refuses_divergent_syntax(main_mod):
+    for p in DIVERGENT + [r"\N{BULLET}", r"a\Z", r"\v"]:
+        assert main_mod.build_hyperscan_db([re.compile(p)]) is None, p
+
+
+def test_hyperscan_candidates_are_confirmed_with_re(monkeypatch, main_mod):
+    pytest.importorskip("hyperscan")
+    entries = _entries(PLAIN)
+    db = main_mod.build_hyperscan_db(rx for rx, _ in entries)
+    assert db is not None
+    # DB 는 모든 라인을 첫 패턴 후보로 보고하지만, re 확인에서 걸러져야 한다
+    loose = main_mod.build_hyperscan_db([re.compile("."), re.compile(r"Rootfs start\d")])
+    _use_entries(monkeypatch, main_mod, entries[:2], hs_db=loose)
+    _assert_same_as_reference(main_mod, entries[:2], LINES)
+
+
+# 앵커(^, $)와 한 라인에 여러 패턴이 걸리는 경우 (우선순위 = 목록 순서)
+ANCHORED = [r"^Rootfs", r"start\d$", r"kernel", r"^Starting kernel \.\.\.$", r"Rootfs start", r"login:"]
+LITERALS = ["Rootfs start", "start3", "kernel", "Starting kernel ...", "login:", "NOTICE:"]
+MULTI_LINES = LINES + [
+    "x Rootfs start3", "Rootfs start3 y", "Rootfs", "start9", "kernel login:",
+    "Starting kernel ... login:", "NOTICE:  Rootfs start3", "start3 Rootfs start",
+]
+
+
+@pytest.mark.parametrize("use_prefilter", [False, True])
+@pytest.mark.parametrize("patterns", [ANCHORED, ANCHORED[::-1], PLAIN + ANCHORED])
+def test_combined_regex_matches_re_reference(monkeypatch, main_mod, patterns, use_prefilter):
+    entries = _entries(patterns)
+    master, groups = main_mod.build_classifier(entries)
+    assert master is not None
+    prefilter = main_mod.build_prefilter(rx for rx, _ in entries) if use_prefilter else None
+    _use_entries(monkeypatch, main_mod, entries, classify_re=master, groups=groups, prefilter=prefilter)
+    _assert_same_as_reference(main_mod, entries, MULTI_LINES)
+
+
+@pytest.mark.parametrize("patterns", [ANCHORED, PLAIN + ANCHORED])
+def test_prefilter_with_per_pattern_fallback(monkeypatch, main_mod, patterns):
+    entries = _entries(patterns)
+    prefilter = main_mod.build_prefilter(rx for rx, _ in entries)
+    assert prefilter is not None
+    _use_entries(monkeypatch, main_mod, entries, prefilter=prefilter)
+    _assert_same_as_reference(main_mod, entries, MULTI_LINES)
+
+
+def _literal_entries(main_mod, literals):
+    entries = _entries([re.escape(lit) for lit in literals])
+    lits = [main_mod.pure_literal(rx) for rx, _ in entries]
+    assert lits == list(literals)
+    return entries, lits
+
+
+@pytest.mark.parametrize("literals", [LITERALS, LITERALS[::-1]])
+def test_literal_in_path_matches_re_reference(monkeypatch, main_mod, literals):
+    entries, lits = _literal_entries(main_mod, literals)
+    literal_entries = [(lit, info) for lit, (_, info) in zip(lits, entries)]
+    _use_entries(monkeypatch, main_mod, entries, literal_entries=literal_entries)
+    _assert_same_as_reference(main_mod, entries, MULTI_LINES)
+
+
+@pytest.mark.parametrize("literals", [LITERALS, LITERALS[::-1]])
+def test_aho_corasick_path_matches_re_reference(monkeypatch, main_mod, literals):
+    pytest.importorskip("ahocorasick")
+    entries, lits = _literal_entries(main_mod, literals)
+    automaton = main_mod.build_literal_automaton(lits)
+    assert automaton is not None
+    _use_entries(monkeypatch, main_mod, entries, automaton=automaton)
+    _assert_same_as_reference(main_mod, entries, MULTI_LINES)